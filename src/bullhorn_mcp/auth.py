@@ -1,20 +1,44 @@
 """Bullhorn OAuth 2.0 authentication handler."""
 
+import os
+import tempfile
+import threading
 import time
 import httpx
-from dataclasses import dataclass
-from urllib.parse import urlencode, urlparse, parse_qs
+import orjson
+from urllib.parse import urlparse, parse_qs
 
 from .config import BullhornConfig
 
+try:
+    import fcntl
+except ImportError:  # Windows - cache file is used without locking
+    fcntl = None
+
+# Connection pool settings shared by the auth and API clients. Idle
+# connections are kept for 30s (httpx default: 5s) so tool calls spaced
+# out by an LLM still reuse them instead of paying DNS + TLS again; this
+# stays below the common 60s load-balancer idle timeout.
+HTTP_LIMITS = httpx.Limits(
+    max_keepalive_connections=20,
+    max_connections=100,
+    keepalive_expiry=30.0,
+)
+
 
-@dataclass
 class BullhornSession:
     """Active Bullhorn API session."""
 
-    bh_rest_token: str
-    rest_url: str
-    expires_at: float  # Unix timestamp
+    __slots__ = ("bh_rest_token", "rest_url", "expires_at", "headers", "base_url")
+
+    def __init__(self, bh_rest_token: str, rest_url: str, expires_at: float):
+        self.bh_rest_token = bh_rest_token
+        self.rest_url = rest_url
+        self.expires_at = expires_at  # Unix timestamp
+        # Built once per session rather than on every API call
+        self.headers = {"BhRestToken": bh_rest_token}
+        # restUrl usually ends with "/"; endpoints start with one
+        self.base_url = rest_url.rstrip("/")
 
 
 class BullhornAuth:
@@ -28,35 +52,97 @@ class BullhornAuth:
     5. Refresh when tokens expire
     """
 
-    def __init__(self, config: BullhornConfig):
+    def __init__(self, config: BullhornConfig, http_client: httpx.Client | None = None):
+        """Create the auth handler.
+
+        Args:
+            config: Bullhorn API configuration
+            http_client: Client to send auth requests with. If omitted, a
+                pooled client is created and closed by close(); a client
+                passed in is left open for its owner to close.
+        """
         self.config = config
         self._session: BullhornSession | None = None
         self._access_token: str | None = None
         self._refresh_token: str | None = None
         self._token_expires_at: float = 0
         self._regional_auth_url: str | None = None  # Set if redirected to regional server
+        self._authorize_url: str | None = None  # Regional server that served /oauth/authorize
+        self._lock = threading.RLock()  # Serializes token refreshes
+        # Bullhorn takes client credentials as query params on /oauth/token
+        # (not a Basic auth header); built once and reused by every grant
+        self._client_credentials = {
+            "client_id": config.client_id,
+            "client_secret": config.client_secret,
+        }
+
+        # One pooled client for the whole auth lifecycle so keep-alive
+        # connections are reused across calls. HTTP/2 lets concurrent
+        # requests multiplex over a single connection.
+        self._owns_http = http_client is None
+        self._http = http_client or httpx.Client(
+            http2=True,
+            follow_redirects=False,
+            limits=HTTP_LIMITS,
+            timeout=30.0,
+        )
+
+        # Reuse a session persisted by a previous process, if still valid
+        if config.session_cache:
+            self._load_cached_session()
+
+    def close(self) -> None:
+        """Close the underlying HTTP connection pool, if created here."""
+        if self._owns_http:
+            self._http.close()
+
+    def current_session(self) -> BullhornSession | None:
+        """Get the cached session without refreshing or blocking.
+
+        Returns:
+            The session, or None if it is missing or about to expire
+        """
+        session = self._session
+        if session is None or time.time() >= session.expires_at - 60:
+            return None
+        return session
 
     @property
     def session(self) -> BullhornSession:
         """Get current session, refreshing if needed."""
-        if self._session is None or time.time() >= self._session.expires_at - 60:
-            self._refresh_session()
-        return self._session
-
-    def _refresh_session(self) -> None:
-        """Refresh the API session."""
-        # If we have a refresh token, try to use it
-        if self._refresh_token and time.time() < self._token_expires_at - 60:
-            try:
-                self._refresh_access_token()
-            except Exception:
-                # Refresh failed, do full auth
+        session = self.current_session()
+        if session is None:
+            with self._lock:
+                # Another thread may have refreshed while we waited
+                session = self.current_session()
+                if session is None:
+                    self._refresh_session()
+                    session = self._session
+        return session
+
+    def _refresh_session(self, stale: BullhornSession | None = None) -> None:
+        """Refresh the API session.
+
+        Args:
+            stale: Session the caller found to be invalid. If another caller
+                has already replaced it, the refresh is skipped.
+        """
+        with self._lock:
+            if stale is not None and self._session is not stale:
+                return
+
+            # If we have a refresh token, try to use it
+            if self._refresh_token and time.time() < self._token_expires_at - 60:
+                try:
+                    self._refresh_access_token()
+                except Exception:
+                    # Refresh failed, do full auth
+                    self._full_auth()
+            else:
                 self._full_auth()
-        else:
-            self._full_auth()
 
-        # Now get REST session
-        self._rest_login()
+            # Now get REST session
+            self._rest_login()
 
     def _full_auth(self) -> None:
         """Perform full OAuth authentication."""
@@ -68,6 +154,22 @@ class BullhornAuth:
 
     def _get_auth_code(self) -> str:
         """Get authorization code using username/password."""
+        # Go straight to the regional server if a previous login was redirected
+        # there, skipping the redirect hop (and a TLS handshake to the global host)
+        if self._authorize_url:
+            try:
+                return self._request_auth_code(self._authorize_url)
+            except (_AuthServerError, httpx.HTTPError):
+                # The regional server is down or unreachable; start over at the
+                # global server, which redirects to wherever the account lives.
+                # Rejected logins are not retried: each attempt counts toward
+                # Bullhorn's failed-login lockout
+                self._authorize_url = None
+
+        return self._request_auth_code(self.config.auth_url)
+
+    def _request_auth_code(self, auth_url: str) -> str:
+        """Request an authorization code, starting at ``auth_url``."""
         params = {
             "client_id": self.config.client_id,
             "response_type": "code",
@@ -76,47 +178,48 @@ class BullhornAuth:
             "password": self.config.password,
         }
 
-        url = f"{self.config.auth_url}/oauth/authorize?{urlencode(params)}"
-
-        with httpx.Client(follow_redirects=False) as client:
-            # May need to follow regional redirects (307 to auth-apac, auth-emea, etc.)
-            max_redirects = 5
-            for _ in range(max_redirects):
-                response = client.get(url)
-
-                if response.status_code not in (301, 302, 303, 307, 308):
-                    break
-
-                location = response.headers.get("location", "")
-                if not location:
-                    break
-
-                parsed = urlparse(location)
-                query_params = parse_qs(parsed.query)
-
-                # Check if this redirect contains the auth code
-                if "code" in query_params:
-                    # Only update regional URL if redirected to a Bullhorn domain
-                    if parsed.netloc and "bullhornstaffing.com" in parsed.netloc:
-                        self._regional_auth_url = f"{parsed.scheme}://{parsed.netloc}"
-                    return query_params["code"][0]
-
-                # Check for OAuth errors
-                if "error" in query_params:
-                    error = query_params.get("error", ["unknown"])[0]
-                    error_desc = query_params.get("error_description", [""])[0]
-                    raise AuthenticationError(f"OAuth error: {error} - {error_desc}")
-
-                # Only follow redirects to Bullhorn domains (regional servers)
-                if "bullhornstaffing.com" in parsed.netloc:
-                    url = location
-                else:
-                    # Non-Bullhorn redirect without code - something's wrong
-                    break
-
-            raise AuthenticationError(
-                f"Failed to get auth code. Status: {response.status_code}"
-            )
+        url = f"{auth_url}/oauth/authorize"
+
+        # May need to follow regional redirects (307 to auth-apac, auth-emea, etc.)
+        max_redirects = 5
+        for _ in range(max_redirects):
+            response = self._http.get(url, params=params, follow_redirects=False)
+
+            if response.status_code not in (301, 302, 303, 307, 308):
+                break
+
+            location = response.headers.get("location", "")
+            if not location:
+                break
+
+            parsed = urlparse(location)
+            query_params = parse_qs(parsed.query)
+
+            # Check if this redirect contains the auth code
+            if "code" in query_params:
+                # Only update regional URL if redirected to a Bullhorn domain
+                if parsed.netloc and "bullhornstaffing.com" in parsed.netloc:
+                    self._regional_auth_url = f"{parsed.scheme}://{parsed.netloc}"
+                return query_params["code"][0]
+
+            # Check for OAuth errors
+            if "error" in query_params:
+                error = query_params.get("error", ["unknown"])[0]
+                error_desc = query_params.get("error_description", [""])[0]
+                raise AuthenticationError(f"OAuth error: {error} - {error_desc}")
+
+            # Only follow redirects to Bullhorn domains (regional servers)
+            if "bullhornstaffing.com" in parsed.netloc:
+                # The location already carries the fully encoded query string
+                url = location
+                params = None
+                self._authorize_url = f"{parsed.scheme}://{parsed.netloc}"
+            else:
+                # Non-Bullhorn redirect without code - something's wrong
+                break
+
+        error = _AuthServerError if response.status_code >= 500 else AuthenticationError
+        raise error(f"Failed to get auth code. Status: {response.status_code}")
 
     def _exchange_auth_code(self, auth_code: str) -> None:
         """Exchange authorization code for access token."""
@@ -125,25 +228,23 @@ class BullhornAuth:
         params = {
             "grant_type": "authorization_code",
             "code": auth_code,
-            "client_id": self.config.client_id,
-            "client_secret": self.config.client_secret,
+            **self._client_credentials,
         }
 
-        with httpx.Client() as client:
-            response = client.post(url, params=params)
+        response = self._http.post(url, params=params)
 
-            if response.status_code != 200:
-                raise AuthenticationError(
-                    f"Token exchange failed: {response.status_code} - {response.text}"
-                )
+        if response.status_code != 200:
+            raise AuthenticationError(
+                f"Token exchange failed: {response.status_code} - {response.text}"
+            )
 
-            data = response.json()
-            self._access_token = data["access_token"]
-            self._refresh_token = data.get("refresh_token")
+        data = orjson.loads(response.content)
+        self._access_token = data["access_token"]
+        self._refresh_token = data.get("refresh_token")
 
-            # Access tokens expire in 10 minutes (600 seconds)
-            expires_in = data.get("expires_in", 600)
-            self._token_expires_at = time.time() + expires_in
+        # Access tokens expire in 10 minutes (600 seconds)
+        expires_in = data.get("expires_in", 600)
+        self._token_expires_at = time.time() + expires_in
 
     def _refresh_access_token(self) -> None:
         """Refresh the access token using refresh token."""
@@ -155,24 +256,22 @@ class BullhornAuth:
         params = {
             "grant_type": "refresh_token",
             "refresh_token": self._refresh_token,
-            "client_id": self.config.client_id,
-            "client_secret": self.config.client_secret,
+            **self._client_credentials,
         }
 
-        with httpx.Client() as client:
-            response = client.post(url, params=params)
+        response = self._http.post(url, params=params)
 
-            if response.status_code != 200:
-                raise AuthenticationError(
-                    f"Token refresh failed: {response.status_code}"
-                )
+        if response.status_code != 200:
+            raise AuthenticationError(
+                f"Token refresh failed: {response.status_code}"
+            )
 
-            data = response.json()
-            self._access_token = data["access_token"]
-            self._refresh_token = data.get("refresh_token", self._refresh_token)
+        data = orjson.loads(response.content)
+        self._access_token = data["access_token"]
+        self._refresh_token = data.get("refresh_token", self._refresh_token)
 
-            expires_in = data.get("expires_in", 600)
-            self._token_expires_at = time.time() + expires_in
+        expires_in = data.get("expires_in", 600)
+        self._token_expires_at = time.time() + expires_in
 
     def _rest_login(self) -> None:
         """Perform REST login to get BhRestToken."""
@@ -185,28 +284,112 @@ class BullhornAuth:
             "access_token": self._access_token,
         }
 
-        with httpx.Client() as client:
-            response = client.get(url, params=params)
+        response = self._http.get(url, params=params)
 
-            if response.status_code != 200:
-                raise AuthenticationError(
-                    f"REST login failed: {response.status_code} - {response.text}"
-                )
-
-            data = response.json()
+        if response.status_code != 200:
+            raise AuthenticationError(
+                f"REST login failed: {response.status_code} - {response.text}"
+            )
 
-            if "BhRestToken" not in data or "restUrl" not in data:
-                raise AuthenticationError(f"Invalid login response: {data}")
+        data = orjson.loads(response.content)
+
+        if "BhRestToken" not in data or "restUrl" not in data:
+            raise AuthenticationError(f"Invalid login response: {data}")
+
+        # Session typically valid for 10 minutes
+        self._session = BullhornSession(
+            bh_rest_token=data["BhRestToken"],
+            rest_url=data["restUrl"],
+            expires_at=time.time() + 600,
+        )
+
+        if self.config.session_cache:
+            self._save_cached_session()
+
+    def _load_cached_session(self) -> None:
+        """Restore tokens and session from the on-disk cache if still valid."""
+        path = self.config.session_cache
+        try:
+            with open(f"{path}.lock", "a") as lock:
+                if fcntl:
+                    fcntl.flock(lock, fcntl.LOCK_SH)
+                with open(path, "rb") as f:
+                    data = orjson.loads(f.read())
+        except (OSError, ValueError):
+            return
+
+        # Ignore valid JSON that isn't a cached session object
+        if not isinstance(data, dict):
+            return
+
+        # Ignore sessions cached for a different account
+        if (
+            data.get("client_id") != self.config.client_id
+            or data.get("username") != self.config.username
+        ):
+            return
+
+        try:
+            if time.time() >= data["expires_at"] - 60:
+                return
 
-            # Session typically valid for 10 minutes
             self._session = BullhornSession(
-                bh_rest_token=data["BhRestToken"],
-                rest_url=data["restUrl"],
-                expires_at=time.time() + 600,
+                bh_rest_token=data["bh_rest_token"],
+                rest_url=data["rest_url"],
+                expires_at=data["expires_at"],
             )
+            self._access_token = data["access_token"]
+            self._refresh_token = data.get("refresh_token")
+            self._token_expires_at = data.get("token_expires_at", 0)
+            self._regional_auth_url = data.get("regional_auth_url")
+        except (KeyError, TypeError):
+            self._session = None
+
+    def _save_cached_session(self) -> None:
+        """Atomically write tokens and session to the on-disk cache (mode 0600)."""
+        path = self.config.session_cache
+        data = {
+            "client_id": self.config.client_id,
+            "username": self.config.username,
+            "access_token": self._access_token,
+            "refresh_token": self._refresh_token,
+            "token_expires_at": self._token_expires_at,
+            "regional_auth_url": self._regional_auth_url,
+            "bh_rest_token": self._session.bh_rest_token,
+            "rest_url": self._session.rest_url,
+            "expires_at": self._session.expires_at,
+        }
+
+        try:
+            directory = os.path.dirname(path) or "."
+            os.makedirs(directory, mode=0o700, exist_ok=True)
+
+            # Serialize writers from concurrent MCP processes
+            with open(f"{path}.lock", "a") as lock:
+                if fcntl:
+                    fcntl.flock(lock, fcntl.LOCK_EX)
+
+                # mkstemp creates the file with mode 0600
+                fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".session-")
+                try:
+                    with os.fdopen(fd, "wb") as f:
+                        f.write(orjson.dumps(data))
+                    os.replace(tmp_path, path)
+                except BaseException:
+                    os.unlink(tmp_path)
+                    raise
+        except OSError:
+            # Caching is best-effort; the in-memory session is still valid
+            pass
 
 
 class AuthenticationError(Exception):
     """Raised when authentication fails."""
 
     pass
+
+
+class _AuthServerError(AuthenticationError):
+    """Raised when an auth server errors (5xx) instead of answering the login."""
+
+    pass
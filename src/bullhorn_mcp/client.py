@@ -1,9 +1,15 @@
 """Bullhorn REST API client."""
 
+import asyncio
+import functools
+import time
 import httpx
+import orjson
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
-from .auth import BullhornAuth
+from .auth import BullhornAuth, BullhornSession, HTTP_LIMITS
 
 
 # Default fields for common entities
@@ -15,40 +21,83 @@ DEFAULT_FIELDS = {
     "ClientContact": "id,firstName,lastName,email,phone,clientCorporation",
 }
 
+# The same default fields as sets, for membership checks; DEFAULT_FIELDS
+# keeps the comma-joined strings sent as the "fields" param
+DEFAULT_FIELDS_SET = {
+    entity: frozenset(fields.split(",")) for entity, fields in DEFAULT_FIELDS.items()
+}
+
+# Entity metadata changes rarely; cache it for an hour
+META_CACHE_TTL = 3600
+
+# Searches search_many() keeps in flight at once, to stay within Bullhorn's
+# per-user concurrency and rate limits
+SEARCH_MANY_CONCURRENCY = 5
+
+
+@functools.lru_cache(maxsize=32)
+def _params_template(entity: str) -> Mapping[str, str]:
+    """Search/query params that depend only on the entity (default fields)."""
+    return MappingProxyType({"fields": DEFAULT_FIELDS.get(entity, "id")})
+
 
 class BullhornClient:
     """Client for interacting with Bullhorn REST API."""
 
     def __init__(self, auth: BullhornAuth):
         self.auth = auth
-
-    def _request(
+        # Async pooled client so concurrent tool calls don't block the event
+        # loop and can share keep-alive (HTTP/2) connections
+        self._http = httpx.AsyncClient(
+            http2=True,
+            limits=HTTP_LIMITS,
+            timeout=30.0,
+        )
+        self._meta_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+
+    async def close(self) -> None:
+        """Close the API and auth HTTP connection pools."""
+        await self._http.aclose()
+        self.auth.close()
+
+    async def _get_session(self) -> BullhornSession:
+        """Get the API session, logging in off the event loop if needed."""
+        session = self.auth.current_session()
+        if session is None:
+            # Auth is synchronous and may log in over the network; run it in a
+            # worker thread so in-flight calls and the transport keep running
+            session = await asyncio.to_thread(getattr, self.auth, "session")
+        return session
+
+    async def _request(
         self, method: str, endpoint: str, params: dict[str, Any] | None = None
     ) -> dict[str, Any]:
         """Make authenticated request to Bullhorn API."""
-        session = self.auth.session
+        session = await self._get_session()
 
-        url = f"{session.rest_url}{endpoint}"
-        headers = {"BhRestToken": session.bh_rest_token}
+        url = session.base_url + endpoint
 
-        with httpx.Client() as client:
-            response = client.request(method, url, params=params, headers=headers)
+        response = await self._http.request(
+            method, url, params=params, headers=session.headers
+        )
 
-            if response.status_code == 401:
-                # Session expired, force refresh and retry
-                self.auth._refresh_session()
-                session = self.auth.session
-                headers = {"BhRestToken": session.bh_rest_token}
-                response = client.request(method, url, params=params, headers=headers)
+        if response.status_code == 401:
+            # Session expired, force refresh (unless a concurrent call already
+            # did) and retry
+            await asyncio.to_thread(self.auth._refresh_session, stale=session)
+            session = await self._get_session()
+            response = await self._http.request(
+                method, url, params=params, headers=session.headers
+            )
 
-            if response.status_code != 200:
-                raise BullhornAPIError(
-                    f"API request failed: {response.status_code} - {response.text}"
-                )
+        if response.status_code != 200:
+            raise BullhornAPIError(
+                f"API request failed: {response.status_code} - {response.text}"
+            )
 
-            return response.json()
+        return orjson.loads(response.content)
 
-    def search(
+    async def search(
         self,
         entity: str,
         query: str,
@@ -70,23 +119,56 @@ class BullhornClient:
         Returns:
             List of matching entities
         """
-        if fields is None:
-            fields = DEFAULT_FIELDS.get(entity, "id")
-
         params = {
+            **_params_template(entity),
             "query": query,
-            "fields": fields,
-            "count": min(count, 500),
+            "count": count,
             "start": start,
         }
 
+        if fields is not None:
+            params["fields"] = fields
+
         if sort:
             params["sort"] = sort
 
-        result = self._request("GET", f"/search/{entity}", params)
+        result = await self._request("GET", f"/search/{entity}", params)
         return result.get("data", [])
 
-    def query(
+    async def search_many(
+        self, requests: list[tuple[str, str, dict[str, Any]]]
+    ) -> list["list[dict[str, Any]] | BullhornAPIError"]:
+        """Run several searches concurrently.
+
+        Up to SEARCH_MANY_CONCURRENCY requests are in flight at once over the
+        shared connection pool. A search the API rejects doesn't discard the
+        others' results; authentication errors still fail the whole batch.
+
+        Args:
+            requests: (entity, query, kwargs) tuples; kwargs are passed to search()
+
+        Returns:
+            One result list per request, in the same order, or the
+            BullhornAPIError raised by a request that failed
+        """
+        semaphore = asyncio.Semaphore(SEARCH_MANY_CONCURRENCY)
+
+        async def run(
+            entity: str, query: str, kwargs: dict[str, Any]
+        ) -> list[dict[str, Any]] | BullhornAPIError:
+            async with semaphore:
+                try:
+                    return await self.search(entity, query, **kwargs)
+                except BullhornAPIError as e:
+                    return e
+
+        return list(
+            await asyncio.gather(
+                *(run(entity, query, kwargs) for entity, query, kwargs in requests)
+            )
+        )
+
+    async def query(
         self,
         entity: str,
         where: str,
@@ -108,23 +190,23 @@ class BullhornClient:
         Returns:
             List of matching entities
         """
-        if fields is None:
-            fields = DEFAULT_FIELDS.get(entity, "id")
-
         params = {
+            **_params_template(entity),
             "where": where,
-            "fields": fields,
-            "count": min(count, 500),
+            "count": count,
             "start": start,
         }
 
+        if fields is not None:
+            params["fields"] = fields
+
         if order_by:
             params["orderBy"] = order_by
 
-        result = self._request("GET", f"/query/{entity}", params)
+        result = await self._request("GET", f"/query/{entity}", params)
         return result.get("data", [])
 
-    def get(
+    async def get(
         self, entity: str, entity_id: int, fields: str | None = None
     ) -> dict[str, Any]:
         """Get a single entity by ID.
@@ -141,10 +223,10 @@ class BullhornClient:
             fields = DEFAULT_FIELDS.get(entity, "*")
 
         params = {"fields": fields}
-        result = self._request("GET", f"/entity/{entity}/{entity_id}", params)
+        result = await self._request("GET", f"/entity/{entity}/{entity_id}", params)
         return result.get("data", {})
 
-    def get_meta(self, entity: str) -> dict[str, Any]:
+    async def get_meta(self, entity: str) -> dict[str, Any]:
         """Get metadata/schema for an entity type.
 
         Args:
@@ -153,8 +235,14 @@ class BullhornClient:
         Returns:
             Entity metadata including available fields
         """
+        cached = self._meta_cache.get(entity)
+        if cached and time.time() - cached[0] < META_CACHE_TTL:
+            return cached[1]
+
         params = {"fields": "*"}
-        return self._request("GET", f"/meta/{entity}", params)
+        result = await self._request("GET", f"/meta/{entity}", params)
+        self._meta_cache[entity] = (time.time(), result)
+        return result
 
 
 class BullhornAPIError(Exception):
@@ -4,6 +4,8 @@ import os
 from dataclasses import dataclass
 from dotenv import load_dotenv
 
+DEFAULT_SESSION_CACHE = os.path.join("~", ".cache", "bullhorn_mcp", "session.json")
+
 
 @dataclass
 class BullhornConfig:
@@ -15,6 +17,7 @@ class BullhornConfig:
     password: str
     auth_url: str = "https://auth.bullhornstaffing.com"
     login_url: str = "https://rest.bullhornstaffing.com"
+    session_cache: str | None = None  # Path to persist the session; None disables
 
     @classmethod
     def from_env(cls) -> "BullhornConfig":
@@ -25,6 +28,8 @@ class BullhornConfig:
         client_secret = os.getenv("BULLHORN_CLIENT_SECRET")
         username = os.getenv("BULLHORN_USERNAME")
         password = os.getenv("BULLHORN_PASSWORD")
+        # Set to an empty string to disable the on-disk session cache
+        session_cache = os.getenv("BULLHORN_SESSION_CACHE", DEFAULT_SESSION_CACHE)
 
         missing = []
         if not client_id:
@@ -46,4 +51,5 @@ class BullhornConfig:
             password=password,
             auth_url=os.getenv("BULLHORN_AUTH_URL", "https://auth.bullhornstaffing.com"),
             login_url=os.getenv("BULLHORN_LOGIN_URL", "https://rest.bullhornstaffing.com"),
+            session_cache=os.path.expanduser(session_cache) if session_cache else None,
         )
@@ -1,39 +1,78 @@
 """Bullhorn CRM MCP Server - Query jobs and candidates via natural language."""
 
-import json
+import asyncio
+import threading
+from typing import Annotated
+
+import orjson
 from mcp.server.fastmcp import FastMCP
+from pydantic import BaseModel, Field
 
 from .config import BullhornConfig
 from .auth import BullhornAuth, AuthenticationError
 from .client import BullhornClient, BullhornAPIError
 
+
+def _load_config() -> BullhornConfig | None:
+    """Load configuration, deferring missing-variable errors to first use."""
+    try:
+        return BullhornConfig.from_env()
+    except ValueError:
+        return None
+
+
+# Configuration parsed once at import so tools don't re-read .env
+_config = _load_config()
+
+# Global client instance (initialized on first use)
+_client: BullhornClient | None = None
+_client_lock = threading.Lock()
+
+
 # Initialize MCP server
 mcp = FastMCP(
     "Bullhorn CRM",
     instructions="Query Bullhorn CRM data - jobs, candidates, and placements",
 )
 
-# Global client instance (initialized on first use)
-_client: BullhornClient | None = None
-
 
 def get_client() -> BullhornClient:
     """Get or create the Bullhorn API client."""
     global _client
     if _client is None:
-        config = BullhornConfig.from_env()
-        auth = BullhornAuth(config)
-        _client = BullhornClient(auth)
+        with _client_lock:
+            if _client is None:
+                # Re-read the environment only to report what is missing
+                config = _config or BullhornConfig.from_env()
+                _client = BullhornClient(BullhornAuth(config))
     return _client
 
 
+# Result sets with more records than this are returned as compact JSON;
+# indentation would add ~30% to an already large payload
+COMPACT_THRESHOLD = 100
+
+
 def format_response(data: list | dict) -> str:
-    """Format API response as readable JSON."""
-    return json.dumps(data, indent=2, default=str)
+    """Format API response as readable JSON (compact for large result sets)."""
+    option = orjson.OPT_NON_STR_KEYS
+    if not isinstance(data, list) or _count_records(data) <= COMPACT_THRESHOLD:
+        option |= orjson.OPT_INDENT_2
+    return orjson.dumps(data, default=str, option=option).decode()
+
+
+def _clamp_limit(limit: int) -> int:
+    """Clamp a tool's limit argument to Bullhorn's 1-500 page size."""
+    return 1 if limit < 1 else 500 if limit > 500 else limit
+
+
+def _count_records(data: list) -> int:
+    """Count records in a result list, including nested multi_search results."""
+    return sum(len(item) if isinstance(item, list) else 1 for item in data)
 
 
 @mcp.tool()
-def list_jobs(
+async def list_jobs(
     query: str | None = None,
     status: str | None = None,
     limit: int = 20,
@@ -57,29 +96,37 @@ def list_jobs(
         - list_jobs(status="Accepting Candidates")
     """
     try:
-        client = get_client()
-
-        # Build search query
-        search_query = query or "isDeleted:0"
-        if status:
-            search_query = f"({search_query}) AND status:\"{status}\""
-
-        results = client.search(
-            entity="JobOrder",
-            query=search_query,
-            fields=fields,
-            count=limit,
-            sort="-dateAdded",
-        )
-
-        return format_response(results)
+        return format_response(await _list_jobs_impl(query, status, limit, fields))
 
     except (AuthenticationError, BullhornAPIError) as e:
         return f"ERROR: {e}"
 
 
+async def _list_jobs_impl(
+    query: str | None = None,
+    status: str | None = None,
+    limit: int = 20,
+    fields: str | None = None,
+) -> list[dict]:
+    """Search job orders for list_jobs, returning the raw records."""
+    client = get_client()
+
+    # Build search query
+    search_query = query or "isDeleted:0"
+    if status:
+        search_query = f"({search_query}) AND status:\"{status}\""
+
+    return await client.search(
+        entity="JobOrder",
+        query=search_query,
+        fields=fields,
+        count=_clamp_limit(limit),
+        sort="-dateAdded",
+    )
+
+
 @mcp.tool()
-def list_candidates(
+async def list_candidates(
     query: str | None = None,
     status: str | None = None,
     limit: int = 20,
@@ -103,29 +150,37 @@ def list_candidates(
         - list_candidates(status="Active", limit=50)
     """
     try:
-        client = get_client()
-
-        # Build search query
-        search_query = query or "isDeleted:0"
-        if status:
-            search_query = f"({search_query}) AND status:\"{status}\""
-
-        results = client.search(
-            entity="Candidate",
-            query=search_query,
-            fields=fields,
-            count=limit,
-            sort="-dateAdded",
-        )
-
-        return format_response(results)
+        return format_response(await _list_candidates_impl(query, status, limit, fields))
 
     except (AuthenticationError, BullhornAPIError) as e:
         return f"ERROR: {e}"
 
 
+async def _list_candidates_impl(
+    query: str | None = None,
+    status: str | None = None,
+    limit: int = 20,
+    fields: str | None = None,
+) -> list[dict]:
+    """Search candidates for list_candidates, returning the raw records."""
+    client = get_client()
+
+    # Build search query
+    search_query = query or "isDeleted:0"
+    if status:
+        search_query = f"({search_query}) AND status:\"{status}\""
+
+    return await client.search(
+        entity="Candidate",
+        query=search_query,
+        fields=fields,
+        count=_clamp_limit(limit),
+        sort="-dateAdded",
+    )
+
+
 @mcp.tool()
-def get_job(job_id: int, fields: str | None = None) -> str:
+async def get_job(job_id: int, fields: str | None = None) -> str:
     """Get details for a specific job order by ID.
 
     Args:
@@ -136,16 +191,19 @@ def get_job(job_id: int, fields: str | None = None) -> str:
         JSON object with job details
     """
     try:
-        client = get_client()
-        result = client.get(entity="JobOrder", entity_id=job_id, fields=fields)
-        return format_response(result)
+        return format_response(await _get_job_impl(job_id, fields))
 
     except (AuthenticationError, BullhornAPIError) as e:
         return f"ERROR: {e}"
 
 
+async def _get_job_impl(job_id: int, fields: str | None = None) -> dict:
+    """Fetch a job order for get_job, returning the raw record."""
+    return await get_client().get(entity="JobOrder", entity_id=job_id, fields=fields)
+
+
 @mcp.tool()
-def get_candidate(candidate_id: int, fields: str | None = None) -> str:
+async def get_candidate(candidate_id: int, fields: str | None = None) -> str:
     """Get details for a specific candidate by ID.
 
     Args:
@@ -156,16 +214,19 @@ def get_candidate(candidate_id: int, fields: str | None = None) -> str:
         JSON object with candidate details
     """
     try:
-        client = get_client()
-        result = client.get(entity="Candidate", entity_id=candidate_id, fields=fields)
-        return format_response(result)
+        return format_response(await _get_candidate_impl(candidate_id, fields))
 
     except (AuthenticationError, BullhornAPIError) as e:
         return f"ERROR: {e}"
 
 
+async def _get_candidate_impl(candidate_id: int, fields: str | None = None) -> dict:
+    """Fetch a candidate for get_candidate, returning the raw record."""
+    return await get_client().get(entity="Candidate", entity_id=candidate_id, fields=fields)
+
+
 @mcp.tool()
-def search_entities(
+async def search_entities(
     entity: str,
     query: str,
     limit: int = 20,
@@ -188,23 +249,83 @@ def search_entities(
         - search_entities(entity="JobSubmission", query="jobOrder.id:12345")
     """
     try:
+        return format_response(await _search_entities_impl(entity, query, limit, fields))
+
+    except (AuthenticationError, BullhornAPIError) as e:
+        return f"ERROR: {e}"
+
+
+async def _search_entities_impl(
+    entity: str,
+    query: str,
+    limit: int = 20,
+    fields: str | None = None,
+) -> list[dict]:
+    """Run a Lucene search for search_entities, returning the raw records."""
+    return await get_client().search(
+        entity=entity,
+        query=query,
+        fields=fields,
+        count=_clamp_limit(limit),
+    )
+
+
+# Most searches one multi_search call may run
+MAX_SEARCHES = 20
+
+
+class SearchSpec(BaseModel):
+    """One search in a multi_search call."""
+
+    entity: str  # Entity type (JobOrder, Candidate, etc.)
+    query: str  # Lucene search query
+    limit: int = 20  # Maximum number of results (1-500)
+    fields: str | None = None  # Comma-separated fields to return
+
+
+@mcp.tool()
+async def multi_search(
+    searches: Annotated[list[SearchSpec], Field(min_length=1, max_length=MAX_SEARCHES)],
+) -> str:
+    """Run several Lucene searches in parallel and return all results at once.
+
+    Args:
+        searches: List of 1-20 searches, each with "entity" and "query" and
+            optional "limit" (1-500, default 20) and "fields"
+
+    Returns:
+        JSON array with one result array per search, in the same order; a
+        search that failed is returned as {"error": "..."} in its place
+
+    Examples:
+        - multi_search(searches=[{"entity": "JobOrder", "query": "isOpen:1"}, {"entity": "Candidate", "query": "skillSet:Python", "limit": 10}])
+    """
+    try:
+        requests = [
+            (
+                spec.entity,
+                spec.query,
+                {"fields": spec.fields, "count": _clamp_limit(spec.limit)},
+            )
+            for spec in searches
+        ]
+
         client = get_client()
+        results = await client.search_many(requests)
 
-        results = client.search(
-            entity=entity,
-            query=query,
-            fields=fields,
-            count=limit,
+        return format_response(
+            [
+                {"error": str(result)} if isinstance(result, BullhornAPIError) else result
+                for result in results
+            ]
         )
 
-        return format_response(results)
-
     except (AuthenticationError, BullhornAPIError) as e:
         return f"ERROR: {e}"
 
 
 @mcp.tool()
-def query_entities(
+async def query_entities(
     entity: str,
     where: str,
     limit: int = 20,
@@ -228,25 +349,51 @@ def query_entities(
         - query_entities(entity="Candidate", where="status='Active'", order_by="-dateAdded")
     """
     try:
-        client = get_client()
-
-        results = client.query(
-            entity=entity,
-            where=where,
-            fields=fields,
-            count=limit,
-            order_by=order_by,
+        return format_response(
+            await _query_entities_impl(entity, where, limit, fields, order_by)
         )
 
-        return format_response(results)
-
     except (AuthenticationError, BullhornAPIError) as e:
         return f"ERROR: {e}"
 
 
+async def _query_entities_impl(
+    entity: str,
+    where: str,
+    limit: int = 20,
+    fields: str | None = None,
+    order_by: str | None = None,
+) -> list[dict]:
+    """Run a WHERE query for query_entities, returning the raw records."""
+    return await get_client().query(
+        entity=entity,
+        where=where,
+        fields=fields,
+        count=_clamp_limit(limit),
+        order_by=order_by,
+    )
+
+
+async def _serve() -> None:
+    """Serve over stdio, then close the shared HTTP connection pools.
+
+    The client is closed here, once per process, rather than in a FastMCP
+    lifespan: that runs once per session (per connection or request on the
+    HTTP transports) and would close the client under the other sessions.
+    It must be closed on the loop that opened its connections.
+    """
+    global _client
+    try:
+        await mcp.run_stdio_async()
+    finally:
+        if _client is not None:
+            await _client.close()
+            _client = None
+
+
 def main():
     """Run the MCP server."""
-    mcp.run()
+    asyncio.run(_serve())
 
 
 if __name__ == "__main__":
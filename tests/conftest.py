@@ -1,12 +1,75 @@
 """Shared test fixtures."""
 
+import json
+import re
+import time
+from pathlib import Path
+from unittest.mock import Mock
+
+import httpx
+import orjson
 import pytest
+import respx
 from bullhorn_mcp.config import BullhornConfig
 from bullhorn_mcp.auth import BullhornAuth, BullhornSession
 from bullhorn_mcp.client import BullhornClient
 
+REST_URL = "https://rest99.bullhornstaffing.com/rest-services/abc123"  # No trailing slash
 
-@pytest.fixture
+# Canned OAuth/login JSON bodies, parsed once for the whole suite
+AUTH_RESPONSES = json.loads(
+    (Path(__file__).parent / "fixtures" / "auth_responses.json").read_text()
+)
+
+# REST API endpoints, compiled at import and registered once per module
+# on the api_router fixture
+API_ROUTES = {
+    "search": re.compile(r"/search/(?P<entity>\w+)"),
+    "query": re.compile(r"/query/(?P<entity>\w+)"),
+    "entity": re.compile(r"/entity/(?P<entity>\w+)/(?P<entity_id>\d+)"),
+    "meta": re.compile(r"/meta/(?P<entity>\w+)"),
+}
+
+# Fixed clock for expiry arithmetic, see the frozen_time fixture
+FIXED_NOW = 1_700_000_000.0
+
+
+def json_response(payload, status: int = 200) -> httpx.Response:
+    """Mock response with a JSON body encoded by orjson rather than stdlib json."""
+    return httpx.Response(
+        status,
+        content=orjson.dumps(payload),
+        headers={"content-type": "application/json"},
+    )
+
+
+# Default reply for every API route; tests override it per route
+_EMPTY_DATA = json_response({"data": []})
+
+
+class StubAuth:
+    """Stand-in for BullhornAuth with a fixed session.
+
+    A plain attribute instead of Mock(spec=...) + PropertyMock; only the
+    methods tests assert on are mocks.
+    """
+
+    def __init__(self, session: BullhornSession):
+        self.session = session
+        self._refresh_session = Mock()
+        self.close = Mock()
+
+    def current_session(self) -> BullhornSession:
+        """Return the fixed session (it never expires)."""
+        return self.session
+
+
+def query_param(route, key: str) -> str:
+    """Query parameter ``key`` of the first request a respx route received."""
+    return route.calls[0].request.url.params[key]
+
+
+@pytest.fixture(scope="session")
 def sample_config():
     """Create a sample configuration for testing."""
     return BullhornConfig(
@@ -19,18 +82,61 @@ def sample_config():
     )
 
 
+@pytest.fixture(scope="session")
+def shared_http_client():
+    """One httpx client reused by every BullhornAuth in the test session."""
+    with httpx.Client(timeout=5.0) as client:
+        yield client
+
+
 @pytest.fixture
+def frozen_time(monkeypatch):
+    """Pin time.time() to FIXED_NOW for the duration of the test."""
+    monkeypatch.setattr(time, "time", lambda: FIXED_NOW)
+    return FIXED_NOW
+
+
+@pytest.fixture(scope="session")
 def mock_session():
-    """Create a mock Bullhorn session."""
-    import time
+    """Create a mock Bullhorn session valid for 10 minutes past FIXED_NOW."""
     return BullhornSession(
         bh_rest_token="test_token_123",
-        rest_url="https://rest99.bullhornstaffing.com/rest-services/abc123",  # No trailing slash
-        expires_at=time.time() + 600,
+        rest_url=REST_URL,
+        expires_at=FIXED_NOW + 600,
     )
 
 
 @pytest.fixture
+def mock_auth(mock_session):
+    """Create a stub auth object with a valid session."""
+    return StubAuth(mock_session)
+
+
+@pytest.fixture(scope="module")
+def api_router():
+    """Mock the REST API under REST_URL with one named route per endpoint.
+
+    The routes are compiled once per module; use ``api_routes`` in tests.
+    """
+    with respx.mock(base_url=REST_URL, assert_all_called=False) as router:
+        for name, pattern in API_ROUTES.items():
+            router.get(path__regex=pattern, name=name)
+        yield router
+
+
+@pytest.fixture
+def api_routes(api_router):
+    """The module's API router with default replies and no recorded calls.
+
+    Override a reply with e.g. ``api_routes["search"].mock(return_value=...)``.
+    """
+    for route in api_router.routes:
+        route.mock(return_value=_EMPTY_DATA)
+    api_router.reset()
+    return api_router
+
+
+@pytest.fixture(scope="session")
 def sample_job():
     """Sample job order data."""
     return {
@@ -46,7 +152,7 @@ def sample_job():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_candidate():
     """Sample candidate data."""
     return {
@@ -59,3 +165,53 @@ def sample_candidate():
         "dateAdded": 1704067200000,
         "occupation": "Software Developer",
     }
+
+
+@pytest.fixture
+def happy_path_auth_routes(respx_mock, sample_config):
+    """Mock a successful authorize -> token -> REST login sequence.
+
+    Routes are named "authorize", "token" and "login" so a test can
+    override a single step, e.g. ``happy_path_auth_routes["token"].mock(...)``.
+    """
+    respx_mock.get(f"{sample_config.auth_url}/oauth/authorize", name="authorize").mock(
+        return_value=httpx.Response(
+            302,
+            headers={"location": "https://callback.example.com?code=auth_code_123"},
+        )
+    )
+    respx_mock.post(f"{sample_config.auth_url}/oauth/token", name="token").mock(
+        return_value=json_response(AUTH_RESPONSES["token_happy_path"])
+    )
+    respx_mock.get(f"{sample_config.login_url}/rest-services/login", name="login").mock(
+        return_value=json_response(AUTH_RESPONSES["login_happy_path"])
+    )
+    return respx_mock
+
+
+@pytest.fixture(scope="session")
+def sample_job_body(sample_job):
+    """Search/query response body holding sample_job, encoded once."""
+    return orjson.dumps({"data": [sample_job]})
+
+
+@pytest.fixture(scope="session")
+def sample_job_response(sample_job_body):
+    """Search/query response holding sample_job, shared by every route.
+
+    respx clones a returned response that has no request bound to it,
+    so this instance is never mutated by the calls it serves.
+    """
+    return httpx.Response(200, content=sample_job_body)
+
+
+@pytest.fixture(scope="session")
+def sample_candidate_body(sample_candidate):
+    """Search/query response body holding sample_candidate, encoded once."""
+    return orjson.dumps({"data": [sample_candidate]})
+
+
+@pytest.fixture(scope="session")
+def sample_job_entity_body(sample_job):
+    """Entity response body for sample_job, encoded once."""
+    return orjson.dumps({"data": sample_job})
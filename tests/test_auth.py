@@ -1,201 +1,137 @@
 """Tests for Bullhorn authentication."""
 
-import time
+import functools
+import json
+import os
+import threading
+from dataclasses import replace
+from unittest.mock import MagicMock
+
 import pytest
 import httpx
-import respx
 from bullhorn_mcp.auth import BullhornAuth, BullhornSession, AuthenticationError
 
-
-class TestBullhornSession:
-    """Tests for BullhornSession class."""
-
-    def test_session_creation(self):
-        """Test creating a session."""
-        session = BullhornSession(
-            bh_rest_token="token123",
-            rest_url="https://rest99.bullhornstaffing.com/rest-services/abc/",
-            expires_at=time.time() + 600,
-        )
-
-        assert session.bh_rest_token == "token123"
-        assert session.rest_url == "https://rest99.bullhornstaffing.com/rest-services/abc/"
-
-    def test_session_expiry(self):
-        """Test session expiry tracking."""
-        # Session that expires in the future
-        future_session = BullhornSession(
-            bh_rest_token="token",
-            rest_url="https://rest.example.com/",
-            expires_at=time.time() + 600,
-        )
-        assert future_session.expires_at > time.time()
-
-        # Session that has expired
-        expired_session = BullhornSession(
-            bh_rest_token="token",
-            rest_url="https://rest.example.com/",
-            expires_at=time.time() - 100,
-        )
-        assert expired_session.expires_at < time.time()
+from .conftest import AUTH_RESPONSES, FIXED_NOW, json_response
+
+# Endpoints for sample_config's default auth/login hosts
+AUTHORIZE_URL = "https://auth.bullhornstaffing.com/oauth/authorize"
+TOKEN_URL = "https://auth.bullhornstaffing.com/oauth/token"
+LOGIN_URL = "https://rest.bullhornstaffing.com/rest-services/login"
+
+# Regional server Bullhorn may redirect the login to
+APAC_AUTH_URL = "https://auth-apac.bullhornstaffing.com"
+
+# respx clones returned responses, so one instance can back every route
+_CODE_REDIRECT_RESP = httpx.Response(
+    302,
+    headers={"location": "https://callback.example.com?code=code123"},
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _token_resp(name: str = "token_ok") -> httpx.Response:
+    """Token endpoint response for a canned body, encoded once."""
+    return json_response(AUTH_RESPONSES[name])
+
+
+_TOKEN_OK = _token_resp()
+
+# (route to override, its failing response, expected error text)
+AUTH_FAILURE_CASES = [
+    pytest.param(
+        "authorize",
+        httpx.Response(
+            302,
+            headers={"location": "https://callback.example.com?error=invalid_client&error_description=Invalid%20client"},
+        ),
+        "invalid_client",
+        id="oauth-error",
+    ),
+    pytest.param(
+        "authorize",
+        httpx.Response(200, text="Login page HTML"),
+        "Failed to get auth code",
+        id="no-auth-code",
+    ),
+    pytest.param(
+        "token",
+        json_response(AUTH_RESPONSES["token_invalid_grant"], 400),
+        "Token exchange failed",
+        id="token-exchange",
+    ),
+    pytest.param(
+        "login",
+        httpx.Response(401, text="Unauthorized"),
+        "REST login failed",
+        id="rest-login",
+    ),
+    pytest.param(
+        "login",
+        # Missing BhRestToken and restUrl
+        json_response(AUTH_RESPONSES["login_missing_token"]),
+        "Invalid login response",
+        id="rest-login-missing-token",
+    ),
+]
 
 
 class TestBullhornAuth:
     """Tests for BullhornAuth class."""
 
-    @respx.mock
-    def test_full_auth_flow(self, sample_config):
+    def test_full_auth_flow(self, shared_http_client, happy_path_auth_routes, sample_config, frozen_time):
         """Test complete authentication flow."""
-        # Mock authorization endpoint - returns redirect with code
-        respx.get(f"{sample_config.auth_url}/oauth/authorize").mock(
-            return_value=httpx.Response(
-                302,
-                headers={"location": "https://callback.example.com?code=auth_code_123"},
-            )
-        )
-
-        # Mock token endpoint
-        respx.post(f"{sample_config.auth_url}/oauth/token").mock(
-            return_value=httpx.Response(
-                200,
-                json={
-                    "access_token": "access_token_123",
-                    "refresh_token": "refresh_token_123",
-                    "expires_in": 600,
-                },
-            )
-        )
-
-        # Mock REST login endpoint
-        respx.get(f"{sample_config.login_url}/rest-services/login").mock(
-            return_value=httpx.Response(
-                200,
-                json={
-                    "BhRestToken": "bh_rest_token_123",
-                    "restUrl": "https://rest99.bullhornstaffing.com/rest-services/abc/",
-                },
-            )
-        )
-
-        auth = BullhornAuth(sample_config)
+        auth = BullhornAuth(sample_config, http_client=shared_http_client)
         session = auth.session
 
         assert session.bh_rest_token == "bh_rest_token_123"
         assert session.rest_url == "https://rest99.bullhornstaffing.com/rest-services/abc/"
-        assert session.expires_at > time.time()
+        assert session.expires_at == FIXED_NOW + 600
+        assert happy_path_auth_routes["token"].calls[0].request.url.params["code"] == "auth_code_123"
 
-    @respx.mock
-    def test_auth_code_error(self, sample_config):
-        """Test handling of OAuth error response."""
-        respx.get(f"{sample_config.auth_url}/oauth/authorize").mock(
-            return_value=httpx.Response(
-                302,
-                headers={"location": "https://callback.example.com?error=invalid_client&error_description=Invalid%20client"},
-            )
-        )
+    @pytest.mark.parametrize("step,override,message", AUTH_FAILURE_CASES)
+    def test_auth_failure_modes(
+        self, shared_http_client, happy_path_auth_routes, sample_config, step, override, message
+    ):
+        """Test that a failure at any step of the login raises AuthenticationError."""
+        happy_path_auth_routes[step].mock(return_value=override)
 
-        auth = BullhornAuth(sample_config)
+        auth = BullhornAuth(sample_config, http_client=shared_http_client)
 
         with pytest.raises(AuthenticationError) as exc_info:
             _ = auth.session
 
-        assert "invalid_client" in str(exc_info.value)
-
-    @respx.mock
-    def test_token_exchange_failure(self, sample_config):
-        """Test handling of token exchange failure."""
-        # Mock successful auth code
-        respx.get(f"{sample_config.auth_url}/oauth/authorize").mock(
-            return_value=httpx.Response(
-                302,
-                headers={"location": "https://callback.example.com?code=auth_code_123"},
-            )
-        )
+        assert message in str(exc_info.value)
 
-        # Mock failed token exchange
-        respx.post(f"{sample_config.auth_url}/oauth/token").mock(
-            return_value=httpx.Response(
-                400,
-                json={"error": "invalid_grant"},
-            )
-        )
-
-        auth = BullhornAuth(sample_config)
-
-        with pytest.raises(AuthenticationError) as exc_info:
-            _ = auth.session
-
-        assert "Token exchange failed" in str(exc_info.value)
-
-    @respx.mock
-    def test_rest_login_failure(self, sample_config):
-        """Test handling of REST login failure."""
-        # Mock successful auth code and token
-        respx.get(f"{sample_config.auth_url}/oauth/authorize").mock(
-            return_value=httpx.Response(
-                302,
-                headers={"location": "https://callback.example.com?code=auth_code_123"},
-            )
-        )
-        respx.post(f"{sample_config.auth_url}/oauth/token").mock(
-            return_value=httpx.Response(
-                200,
-                json={"access_token": "token", "expires_in": 600},
-            )
-        )
-
-        # Mock failed REST login
-        respx.get(f"{sample_config.login_url}/rest-services/login").mock(
-            return_value=httpx.Response(401, text="Unauthorized")
-        )
-
-        auth = BullhornAuth(sample_config)
-
-        with pytest.raises(AuthenticationError) as exc_info:
-            _ = auth.session
-
-        assert "REST login failed" in str(exc_info.value)
-
-    @respx.mock
-    def test_session_caching(self, sample_config):
+    def test_session_caching(self, shared_http_client, sample_config, mock_session, monkeypatch, frozen_time):
         """Test that session is cached and reused."""
-        # Set up mocks
-        auth_route = respx.get(f"{sample_config.auth_url}/oauth/authorize").mock(
-            return_value=httpx.Response(
-                302,
-                headers={"location": "https://callback.example.com?code=code123"},
-            )
-        )
-        respx.post(f"{sample_config.auth_url}/oauth/token").mock(
-            return_value=httpx.Response(
-                200,
-                json={"access_token": "token", "expires_in": 600},
-            )
-        )
-        respx.get(f"{sample_config.login_url}/rest-services/login").mock(
-            return_value=httpx.Response(
-                200,
-                json={
-                    "BhRestToken": "cached_token",
-                    "restUrl": "https://rest.example.com/",
-                },
-            )
+        auth = BullhornAuth(sample_config, http_client=shared_http_client)
+        refresh = MagicMock(side_effect=lambda: setattr(auth, "_session", mock_session))
+        monkeypatch.setattr(auth, "_refresh_session", refresh)
+
+        assert auth.session is auth.session
+        assert refresh.call_count == 1
+
+    @pytest.mark.parametrize(
+        "expires_in, cached",
+        [
+            pytest.param(600, True, id="valid"),
+            pytest.param(30, False, id="near-expiry"),
+        ],
+    )
+    def test_current_session(self, shared_http_client, sample_config, frozen_time, expires_in, cached):
+        """Test that current_session() returns only a usable cached session."""
+        auth = BullhornAuth(sample_config, http_client=shared_http_client)
+        assert auth.current_session() is None
+
+        auth._session = BullhornSession(
+            bh_rest_token="token",
+            rest_url="https://rest.example.com/",
+            expires_at=FIXED_NOW + expires_in,
         )
 
-        auth = BullhornAuth(sample_config)
-
-        # First access - should trigger auth
-        session1 = auth.session
-        assert auth_route.call_count == 1
-
-        # Second access - should use cached session
-        session2 = auth.session
-        assert auth_route.call_count == 1  # Still 1, no new auth
-
-        assert session1.bh_rest_token == session2.bh_rest_token
+        assert (auth.current_session() is auth._session) is cached
 
-    @respx.mock
-    def test_regional_redirect_307(self, sample_config):
+    def test_regional_redirect_307(self, shared_http_client, respx_mock, sample_config):
         """Test handling of 307 redirect to regional Bullhorn server.
 
         When Bullhorn redirects to a regional server (307), we follow it.
@@ -203,16 +139,16 @@ class TestBullhornAuth:
         the auth code is to a Bullhorn domain.
         """
         # First request gets 307 redirect to regional server
-        respx.get(f"{sample_config.auth_url}/oauth/authorize").mock(
+        global_route = respx_mock.get(AUTHORIZE_URL).mock(
             return_value=httpx.Response(
                 307,
-                headers={"location": "https://auth-apac.bullhornstaffing.com/oauth/authorize?client_id=test"},
+                headers={"location": f"{APAC_AUTH_URL}/oauth/authorize?client_id=test"},
             )
         )
 
         # Regional server returns auth code in redirect to external callback
         # (This is the typical OAuth flow - redirect to registered callback URL)
-        respx.get("https://auth-apac.bullhornstaffing.com/oauth/authorize").mock(
+        regional_route = respx_mock.get(f"{APAC_AUTH_URL}/oauth/authorize").mock(
             return_value=httpx.Response(
                 302,
                 headers={"location": "https://callback.example.com?code=regional_code_123"},
@@ -221,217 +157,299 @@ class TestBullhornAuth:
 
         # Token exchange uses original auth URL (regional URL not captured
         # because callback.example.com is not a Bullhorn domain)
-        respx.post(f"{sample_config.auth_url}/oauth/token").mock(
-            return_value=httpx.Response(
-                200,
-                json={
-                    "access_token": "regional_access_token",
-                    "refresh_token": "regional_refresh_token",
-                    "expires_in": 600,
-                },
-            )
+        respx_mock.post(TOKEN_URL).mock(
+            return_value=_token_resp("token_regional")
         )
 
         # REST login
-        respx.get(f"{sample_config.login_url}/rest-services/login").mock(
-            return_value=httpx.Response(
-                200,
-                json={
-                    "BhRestToken": "bh_token_regional",
-                    "restUrl": "https://rest-apac.bullhornstaffing.com/rest-services/abc/",
-                },
-            )
+        respx_mock.get(LOGIN_URL).mock(
+            return_value=json_response(AUTH_RESPONSES["login_regional"])
         )
 
-        auth = BullhornAuth(sample_config)
+        auth = BullhornAuth(sample_config, http_client=shared_http_client)
         session = auth.session
 
         assert session.bh_rest_token == "bh_token_regional"
         # Regional URL is not set when callback is to external domain
         assert auth._regional_auth_url is None
-
-    @respx.mock
-    def test_regional_redirect_with_bullhorn_callback(self, sample_config):
-        """Test that regional URL is captured when redirect contains Bullhorn domain."""
-        # Redirect directly to regional Bullhorn domain with auth code
-        respx.get(f"{sample_config.auth_url}/oauth/authorize").mock(
+        # Credentials are sent as query params on the first hop only; the
+        # regional hop uses the redirect location as given
+        assert global_route.calls[0].request.url.params["username"] == "test_user"
+        assert regional_route.calls[0].request.url.query == b"client_id=test"
+
+    def test_reauth_starts_at_regional_server(self, shared_http_client, respx_mock, sample_config):
+        """Test that later logins skip the redirect from the global auth server."""
+        global_route = respx_mock.get(AUTHORIZE_URL).mock(
             return_value=httpx.Response(
-                302,
-                headers={"location": "https://auth-apac.bullhornstaffing.com/callback?code=regional_code_123"},
-            )
-        )
-
-        # Token exchange uses regional URL
-        respx.post("https://auth-apac.bullhornstaffing.com/oauth/token").mock(
-            return_value=httpx.Response(
-                200,
-                json={
-                    "access_token": "regional_access_token",
-                    "refresh_token": "regional_refresh_token",
-                    "expires_in": 600,
-                },
+                307,
+                headers={"location": f"{APAC_AUTH_URL}/oauth/authorize?client_id=test"},
             )
         )
-
-        # REST login
-        respx.get(f"{sample_config.login_url}/rest-services/login").mock(
+        regional_route = respx_mock.get(f"{APAC_AUTH_URL}/oauth/authorize").mock(
             return_value=httpx.Response(
-                200,
-                json={
-                    "BhRestToken": "bh_token_regional",
-                    "restUrl": "https://rest-apac.bullhornstaffing.com/rest-services/abc/",
-                },
+                302,
+                headers={"location": "https://callback.example.com?code=regional_code_123"},
             )
         )
+        respx_mock.post(TOKEN_URL).mock(return_value=_TOKEN_OK)
+
+        auth = BullhornAuth(sample_config, http_client=shared_http_client)
+        auth._full_auth()
+        auth._full_auth()
+
+        assert global_route.call_count == 1
+        assert regional_route.call_count == 2
+        assert auth._authorize_url == APAC_AUTH_URL
+
+    @pytest.mark.parametrize(
+        "failure",
+        [
+            pytest.param(httpx.Response(500), id="server-error"),
+            pytest.param(httpx.ConnectError("unreachable"), id="connect-error"),
+        ],
+    )
+    def test_reauth_falls_back_to_global_server(
+        self, shared_http_client, respx_mock, happy_path_auth_routes, sample_config, failure
+    ):
+        """Test that an unavailable cached regional server is dropped for the global one."""
+        regional_route = respx_mock.get(f"{APAC_AUTH_URL}/oauth/authorize").mock(
+            side_effect=[failure]
+        )
+
+        auth = BullhornAuth(sample_config, http_client=shared_http_client)
+        auth._authorize_url = APAC_AUTH_URL
+        auth._full_auth()
+
+        assert regional_route.call_count == 1
+        assert happy_path_auth_routes["authorize"].call_count == 1
+        assert auth._authorize_url is None
+        assert auth._access_token is not None
+
+    @pytest.mark.parametrize(
+        "rejection",
+        [
+            pytest.param(
+                httpx.Response(
+                    302,
+                    headers={"location": "https://callback.example.com?error=access_denied"},
+                ),
+                id="oauth-error",
+            ),
+            pytest.param(httpx.Response(200, text="Login page HTML"), id="login-page"),
+        ],
+    )
+    def test_rejected_login_not_retried_at_global_server(
+        self, shared_http_client, respx_mock, happy_path_auth_routes, sample_config, rejection
+    ):
+        """Test that a rejected login submits the password once per attempt."""
+        respx_mock.get(f"{APAC_AUTH_URL}/oauth/authorize").mock(return_value=rejection)
+
+        auth = BullhornAuth(sample_config, http_client=shared_http_client)
+        auth._authorize_url = APAC_AUTH_URL
+        with pytest.raises(AuthenticationError):
+            auth._full_auth()
+
+        submissions = [
+            call for call in respx_mock.calls if "password" in call.request.url.params
+        ]
+        assert len(submissions) == 1
+        assert not happy_path_auth_routes["authorize"].called
+
+    @pytest.mark.parametrize(
+        "redirect_location, expected_regional",
+        [
+            pytest.param("https://callback.example.com?code=c", None, id="external-callback"),
+            pytest.param(
+                f"{APAC_AUTH_URL}/callback?code=c", APAC_AUTH_URL, id="bullhorn-callback"
+            ),
+            pytest.param("https://myapp.example.com/callback?code=c", None, id="app-callback"),
+        ],
+    )
+    def test_auth_code_redirect(
+        self,
+        shared_http_client,
+        respx_mock,
+        happy_path_auth_routes,
+        sample_config,
+        redirect_location,
+        expected_regional,
+    ):
+        """Test that the regional URL is only captured from a Bullhorn-domain redirect."""
+        happy_path_auth_routes["authorize"].mock(
+            return_value=httpx.Response(302, headers={"location": redirect_location})
+        )
+        if expected_regional:
+            respx_mock.post(f"{expected_regional}/oauth/token").mock(return_value=_TOKEN_OK)
+
+        auth = BullhornAuth(sample_config, http_client=shared_http_client)
+        _ = auth.session
+
+        assert auth._regional_auth_url == expected_regional
+        # The code is exchanged at the regional server when one was captured
+        token_url = f"{expected_regional}/oauth/token" if expected_regional else TOKEN_URL
+        token_request = next(c.request for c in respx_mock.calls if c.request.method == "POST")
+        assert token_request.url.copy_with(query=None) == token_url
+        assert token_request.url.params["code"] == "c"
+
+    def test_refresh_token_uses_regional_url(self, shared_http_client, respx_mock, sample_config):
+        """Test that code exchange and token refresh both use the regional URL when set."""
+        auth = BullhornAuth(sample_config, http_client=shared_http_client)
+        auth._regional_auth_url = "https://auth-emea.bullhornstaffing.com"
+
+        # One route serves both grants: initial exchange, then refresh
+        token_route = respx_mock.post("https://auth-emea.bullhornstaffing.com/oauth/token")
+        token_route.side_effect = [
+            _token_resp("token_initial"),
+            _token_resp("token_refreshed"),
+        ]
+
+        auth._exchange_auth_code("code123")
+        auth._refresh_access_token()
 
-        auth = BullhornAuth(sample_config)
-        session = auth.session
+        assert token_route.call_count == 2
+        assert token_route.calls[0].request.url.params["grant_type"] == "authorization_code"
+        assert token_route.calls[1].request.url.params["refresh_token"] == "refresh_123"
+        assert auth._access_token == "refreshed_token"
+        assert auth._refresh_token == "new_refresh"
 
-        assert session.bh_rest_token == "bh_token_regional"
-        assert auth._regional_auth_url == "https://auth-apac.bullhornstaffing.com"
+    def test_client_credentials_sent_on_every_grant(self, shared_http_client, respx_mock, sample_config):
+        """Test that the cached client credentials go on both token grants."""
+        auth = BullhornAuth(sample_config, http_client=shared_http_client)
+        token_route = respx_mock.post(TOKEN_URL).mock(return_value=_token_resp("token_initial"))
 
-    @respx.mock
-    def test_auth_code_in_redirect_without_regional_domain(self, sample_config):
-        """Test extracting auth code from non-Bullhorn callback URL."""
-        # Auth code returned in redirect to external callback URL
-        respx.get(f"{sample_config.auth_url}/oauth/authorize").mock(
-            return_value=httpx.Response(
-                302,
-                headers={"location": "https://myapp.example.com/callback?code=external_code_456"},
-            )
-        )
+        auth._exchange_auth_code("code123")
+        auth._refresh_access_token()
 
-        # Token exchange (uses original auth URL since no regional redirect)
-        respx.post(f"{sample_config.auth_url}/oauth/token").mock(
-            return_value=httpx.Response(
-                200,
-                json={
-                    "access_token": "access_token",
-                    "refresh_token": "refresh_token",
-                    "expires_in": 600,
-                },
-            )
-        )
+        assert token_route.call_count == 2
+        for call in token_route.calls:
+            assert call.request.url.params["client_id"] == "test_client_id"
+            assert call.request.url.params["client_secret"] == "test_client_secret"
 
-        # REST login
-        respx.get(f"{sample_config.login_url}/rest-services/login").mock(
-            return_value=httpx.Response(
-                200,
-                json={
-                    "BhRestToken": "bh_token",
-                    "restUrl": "https://rest.bullhornstaffing.com/rest-services/abc/",
-                },
-            )
+    def test_concurrent_session_access_refreshes_once(self, shared_http_client, respx_mock, sample_config):
+        """Test that concurrent callers share a single token refresh."""
+        auth_route = respx_mock.get(AUTHORIZE_URL).mock(return_value=_CODE_REDIRECT_RESP)
+        respx_mock.post(TOKEN_URL).mock(return_value=_TOKEN_OK)
+        respx_mock.get(LOGIN_URL).mock(
+            return_value=json_response(AUTH_RESPONSES["login_ok"])
         )
 
-        auth = BullhornAuth(sample_config)
-        session = auth.session
+        auth = BullhornAuth(sample_config, http_client=shared_http_client)
+        threads = [threading.Thread(target=lambda: auth.session) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
 
-        assert session.bh_rest_token == "bh_token"
-        # Regional URL should not be set when callback is to external domain
-        assert auth._regional_auth_url is None
+        assert auth_route.call_count == 1
 
-    @respx.mock
-    def test_refresh_token_uses_regional_url(self, sample_config):
-        """Test that token refresh uses regional URL when set."""
-        # Initial auth with regional redirect
-        respx.get(f"{sample_config.auth_url}/oauth/authorize").mock(
-            return_value=httpx.Response(
-                302,
-                headers={"location": "https://auth-emea.bullhornstaffing.com/callback?code=code123"},
-            )
+    def test_refresh_skipped_when_session_already_replaced(
+        self, shared_http_client, respx_mock, sample_config, frozen_time
+    ):
+        """Test that a stale-session refresh is a no-op once another caller refreshed."""
+        auth = BullhornAuth(sample_config, http_client=shared_http_client)
+        current = BullhornSession(
+            bh_rest_token="fresh",
+            rest_url="https://rest.example.com/",
+            expires_at=FIXED_NOW + 600,
         )
-
-        # Token exchange at regional URL
-        respx.post("https://auth-emea.bullhornstaffing.com/oauth/token").mock(
-            return_value=httpx.Response(
-                200,
-                json={
-                    "access_token": "initial_token",
-                    "refresh_token": "refresh_123",
-                    "expires_in": 600,
-                },
-            )
+        stale = BullhornSession(
+            bh_rest_token="stale",
+            rest_url="https://rest.example.com/",
+            expires_at=FIXED_NOW + 600,
         )
+        auth._session = current
 
-        # REST login
-        respx.get(f"{sample_config.login_url}/rest-services/login").mock(
-            return_value=httpx.Response(
-                200,
-                json={
-                    "BhRestToken": "bh_token",
-                    "restUrl": "https://rest.example.com/",
-                },
-            )
-        )
+        # No routes are mocked, so any network call would raise
+        auth._refresh_session(stale=stale)
 
+        assert auth.session is current
+
+    def test_close_releases_http_client(self, sample_config):
+        """Test that close() shuts down the pooled HTTP client."""
         auth = BullhornAuth(sample_config)
-        _ = auth.session  # Trigger initial auth
+        auth.close()
 
-        # Verify regional URL was captured
-        assert auth._regional_auth_url == "https://auth-emea.bullhornstaffing.com"
+        assert auth._http.is_closed
 
-        # Now test refresh - should use regional URL
-        refresh_route = respx.post("https://auth-emea.bullhornstaffing.com/oauth/token").mock(
-            return_value=httpx.Response(
-                200,
-                json={
-                    "access_token": "refreshed_token",
-                    "refresh_token": "new_refresh",
-                    "expires_in": 600,
-                },
-            )
-        )
+    def test_close_leaves_injected_client_open(self, sample_config):
+        """Test that close() doesn't close a client owned by the caller."""
+        with httpx.Client() as http_client:
+            auth = BullhornAuth(sample_config, http_client=http_client)
+            auth.close()
 
-        # Force a refresh
-        auth._refresh_access_token()
+            assert not http_client.is_closed
 
-        # Verify refresh was called at regional URL
-        assert refresh_route.called
-        assert auth._access_token == "refreshed_token"
 
-    @respx.mock
-    def test_no_auth_code_in_response(self, sample_config):
-        """Test error when no auth code is returned."""
-        # Response with no code parameter
-        respx.get(f"{sample_config.auth_url}/oauth/authorize").mock(
-            return_value=httpx.Response(200, text="Login page HTML")
-        )
+@pytest.mark.usefixtures("frozen_time")
+class TestSessionCache:
+    """Tests for persisting the session across process restarts."""
 
-        auth = BullhornAuth(sample_config)
+    def test_session_written_and_reused(self, shared_http_client, happy_path_auth_routes, sample_config, tmp_path):
+        """Test that a new process reuses the cached session without logging in."""
+        config = replace(sample_config, session_cache=str(tmp_path / "session.json"))
+        login_route = happy_path_auth_routes["login"]
 
-        with pytest.raises(AuthenticationError) as exc_info:
-            _ = auth.session
+        _ = BullhornAuth(config, http_client=shared_http_client).session
+        assert login_route.call_count == 1
+        assert os.stat(config.session_cache).st_mode & 0o777 == 0o600
 
-        assert "Failed to get auth code" in str(exc_info.value)
+        # A fresh instance picks up the cached session
+        auth = BullhornAuth(config, http_client=shared_http_client)
+        session = auth.session
 
-    @respx.mock
-    def test_rest_login_missing_token(self, sample_config):
-        """Test error when REST login returns incomplete data."""
-        respx.get(f"{sample_config.auth_url}/oauth/authorize").mock(
-            return_value=httpx.Response(
-                302,
-                headers={"location": "https://callback.example.com?code=code123"},
-            )
-        )
-        respx.post(f"{sample_config.auth_url}/oauth/token").mock(
-            return_value=httpx.Response(
-                200,
-                json={"access_token": "token", "expires_in": 600},
+        assert login_route.call_count == 1
+        assert session.bh_rest_token == "bh_rest_token_123"
+        assert auth._refresh_token == "refresh_token_123"
+
+    def test_expired_cache_ignored(self, shared_http_client, happy_path_auth_routes, sample_config, tmp_path):
+        """Test that an expired cached session triggers a fresh login."""
+        config = replace(sample_config, session_cache=str(tmp_path / "session.json"))
+        login_route = happy_path_auth_routes["login"]
+
+        _ = BullhornAuth(config, http_client=shared_http_client).session
+        with open(config.session_cache) as f:
+            data = json.load(f)
+        data["expires_at"] = FIXED_NOW - 10
+        with open(config.session_cache, "w") as f:
+            json.dump(data, f)
+
+        _ = BullhornAuth(config, http_client=shared_http_client).session
+
+        assert login_route.call_count == 2
+
+    def test_cache_for_other_account_ignored(self, shared_http_client, sample_config, tmp_path):
+        """Test that a session cached for different credentials is not reused."""
+        config = replace(sample_config, session_cache=str(tmp_path / "session.json"))
+        with open(config.session_cache, "w") as f:
+            json.dump(
+                {
+                    "client_id": config.client_id,
+                    "username": "someone_else",
+                    "access_token": "token",
+                    "bh_rest_token": "other_token",
+                    "rest_url": "https://rest.example.com/",
+                    "expires_at": FIXED_NOW + 600,
+                },
+                f,
             )
-        )
 
-        # REST login returns incomplete data
-        respx.get(f"{sample_config.login_url}/rest-services/login").mock(
-            return_value=httpx.Response(
-                200,
-                json={"someOtherField": "value"},  # Missing BhRestToken and restUrl
-            )
-        )
+        auth = BullhornAuth(config, http_client=shared_http_client)
 
-        auth = BullhornAuth(sample_config)
+        assert auth._session is None
 
-        with pytest.raises(AuthenticationError) as exc_info:
-            _ = auth.session
+    @pytest.mark.parametrize(
+        "contents",
+        [
+            pytest.param("not json", id="not-json"),
+            pytest.param("[]", id="list"),
+            pytest.param("null", id="null"),
+        ],
+    )
+    def test_corrupt_cache_ignored(self, shared_http_client, sample_config, tmp_path, contents):
+        """Test that an unreadable cache file is ignored."""
+        config = replace(sample_config, session_cache=str(tmp_path / "session.json"))
+        (tmp_path / "session.json").write_text(contents)
+
+        auth = BullhornAuth(config, http_client=shared_http_client)
 
-        assert "Invalid login response" in str(exc_info.value)
+        assert auth._session is None
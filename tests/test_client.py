@@ -1,155 +1,199 @@
 """Tests for Bullhorn API client."""
 
+import asyncio
+import threading
 import time
+from unittest.mock import Mock
+
 import pytest
 import httpx
 import respx
-from unittest.mock import Mock, PropertyMock
-from bullhorn_mcp.auth import BullhornAuth, BullhornSession
-from bullhorn_mcp.client import BullhornClient, BullhornAPIError, DEFAULT_FIELDS
+from bullhorn_mcp.auth import BullhornSession
+from bullhorn_mcp.client import BullhornClient, BullhornAPIError, DEFAULT_FIELDS, DEFAULT_FIELDS_SET
+from bullhorn_mcp.client import SEARCH_MANY_CONCURRENCY
+
+from .conftest import FIXED_NOW, json_response, query_param
+
+# Expired-session reply; respx clones it per call, so one instance serves all
+UNAUTHORIZED = httpx.Response(401, text="Unauthorized")
 
 
 @pytest.fixture
-def mock_auth(mock_session):
-    """Create a mock auth object with a valid session."""
-    auth = Mock(spec=BullhornAuth)
-    type(auth).session = PropertyMock(return_value=mock_session)
-    return auth
+async def client(mock_auth):
+    """Create a client for one test (its meta cache is per instance)."""
+    client = BullhornClient(mock_auth)
+    yield client
+    await client.close()
 
 
 class TestBullhornClient:
     """Tests for BullhornClient class."""
 
-    @respx.mock
-    def test_search_jobs(self, mock_auth, mock_session, sample_job):
+    async def test_search_jobs(self, client, api_routes, sample_job_response):
         """Test searching for jobs."""
-        respx.get(f"{mock_session.rest_url}/search/JobOrder").mock(
-            return_value=httpx.Response(
-                200,
-                json={"data": [sample_job]},
-            )
-        )
+        route = api_routes["search"].mock(return_value=sample_job_response)
 
-        client = BullhornClient(mock_auth)
-        results = client.search("JobOrder", "isOpen:1", count=10)
+        results = await client.search("JobOrder", "isOpen:1", count=10)
 
+        assert route.calls[0].request.url.path.endswith("/search/JobOrder")
         assert len(results) == 1
         assert results[0]["id"] == 12345
         assert results[0]["title"] == "Software Engineer"
 
+    async def test_request_sends_session_token(self, client, api_routes):
+        """Test that the cached session header is sent with API calls."""
+        route = api_routes["search"]
+
+        await client.search("JobOrder", "isOpen:1")
+
+        assert route.calls[0].request.headers["BhRestToken"] == "test_token_123"
+
     @respx.mock
-    def test_search_candidates(self, mock_auth, mock_session, sample_candidate):
+    async def test_request_url_with_trailing_slash_rest_url(self, client, mock_auth):
+        """Test that a restUrl ending in "/" doesn't produce a double slash."""
+        mock_auth.session = BullhornSession(
+            bh_rest_token="token",
+            rest_url="https://rest99.bullhornstaffing.com/rest-services/abc/",
+            expires_at=FIXED_NOW + 600,
+        )
+        route = respx.get(
+            "https://rest99.bullhornstaffing.com/rest-services/abc/search/JobOrder"
+        ).mock(return_value=json_response({"data": []}))
+
+        await client.search("JobOrder", "isOpen:1")
+
+        assert route.called
+
+    async def test_search_candidates(self, client, api_routes, sample_candidate_body):
         """Test searching for candidates."""
-        respx.get(f"{mock_session.rest_url}/search/Candidate").mock(
-            return_value=httpx.Response(
-                200,
-                json={"data": [sample_candidate]},
-            )
+        api_routes["search"].mock(
+            return_value=httpx.Response(200, content=sample_candidate_body)
         )
 
-        client = BullhornClient(mock_auth)
-        results = client.search("Candidate", "lastName:Smith")
+        results = await client.search("Candidate", "lastName:Smith")
 
         assert len(results) == 1
         assert results[0]["firstName"] == "John"
         assert results[0]["lastName"] == "Smith"
 
-    @respx.mock
-    def test_search_with_custom_fields(self, mock_auth, mock_session):
+    async def test_search_with_custom_fields(self, client, api_routes):
         """Test search with custom fields."""
-        route = respx.get(f"{mock_session.rest_url}/search/JobOrder").mock(
-            return_value=httpx.Response(200, json={"data": []})
-        )
+        route = api_routes["search"]
 
-        client = BullhornClient(mock_auth)
-        client.search("JobOrder", "isOpen:1", fields="id,title,salary")
+        await client.search("JobOrder", "isOpen:1", fields="id,title,salary")
 
         # Check that custom fields were passed
-        assert "fields=id%2Ctitle%2Csalary" in str(route.calls[0].request.url)
+        assert query_param(route, "fields") == "id,title,salary"
 
-    @respx.mock
-    def test_search_with_sort(self, mock_auth, mock_session):
+    async def test_search_with_sort(self, client, api_routes):
         """Test search with sort parameter."""
-        route = respx.get(f"{mock_session.rest_url}/search/JobOrder").mock(
-            return_value=httpx.Response(200, json={"data": []})
-        )
+        route = api_routes["search"]
 
-        client = BullhornClient(mock_auth)
-        client.search("JobOrder", "isOpen:1", sort="-dateAdded")
+        await client.search("JobOrder", "isOpen:1", sort="-dateAdded")
 
-        assert "sort=-dateAdded" in str(route.calls[0].request.url)
+        assert query_param(route, "sort") == "-dateAdded"
 
-    @respx.mock
-    def test_search_count_limit(self, mock_auth, mock_session):
-        """Test that count is limited to 500."""
-        route = respx.get(f"{mock_session.rest_url}/search/JobOrder").mock(
-            return_value=httpx.Response(200, json={"data": []})
+    async def test_search_many(self, client, api_routes, sample_job_body, sample_candidate_body):
+        """Test running several searches concurrently."""
+        bodies = {"JobOrder": sample_job_body, "Candidate": sample_candidate_body}
+        route = api_routes["search"].mock(
+            side_effect=lambda request, entity: httpx.Response(200, content=bodies[entity])
+        )
+
+        results = await client.search_many(
+            [
+                ("JobOrder", "isOpen:1", {}),
+                ("Candidate", "lastName:Smith", {"count": 5}),
+            ]
         )
 
-        client = BullhornClient(mock_auth)
-        client.search("JobOrder", "isOpen:1", count=1000)  # Request more than max
+        assert results[0][0]["id"] == 12345
+        assert results[1][0]["id"] == 67890
+        candidate_request = next(
+            c.request for c in route.calls if c.request.url.path.endswith("/Candidate")
+        )
+        assert candidate_request.url.params["count"] == "5"
 
-        # Should be capped at 500
-        assert "count=500" in str(route.calls[0].request.url)
+    async def test_search_many_bounds_concurrency(self, client, api_routes):
+        """Test that search_many keeps at most SEARCH_MANY_CONCURRENCY requests in flight."""
+        in_flight = 0
+        peak = 0
 
-    @respx.mock
-    def test_query_entities(self, mock_auth, mock_session, sample_job):
-        """Test querying entities with WHERE clause."""
-        respx.get(f"{mock_session.rest_url}/query/JobOrder").mock(
-            return_value=httpx.Response(
-                200,
-                json={"data": [sample_job]},
+        async def respond(request, entity):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return json_response({"data": []})
+
+        route = api_routes["search"].mock(side_effect=respond)
+
+        await client.search_many(
+            [("JobOrder", "isOpen:1", {})] * (SEARCH_MANY_CONCURRENCY * 2 + 1)
+        )
+
+        assert route.call_count == SEARCH_MANY_CONCURRENCY * 2 + 1
+        assert peak == SEARCH_MANY_CONCURRENCY
+
+    async def test_search_many_returns_failures_in_place(
+        self, client, api_routes, sample_job_body
+    ):
+        """Test that one failed search doesn't discard the other results."""
+        api_routes["search"].mock(
+            side_effect=lambda request, entity: (
+                httpx.Response(200, content=sample_job_body)
+                if entity == "JobOrder"
+                else httpx.Response(400, text="Bad query")
             )
         )
 
-        client = BullhornClient(mock_auth)
-        results = client.query("JobOrder", "salary > 100000")
+        results = await client.search_many(
+            [("JobOrder", "isOpen:1", {}), ("Candidate", "bad:[", {})]
+        )
+
+        assert results[0][0]["id"] == 12345
+        assert isinstance(results[1], BullhornAPIError)
+        assert "400" in str(results[1])
+
+    async def test_query_entities(self, client, api_routes, sample_job_response):
+        """Test querying entities with WHERE clause."""
+        api_routes["query"].mock(return_value=sample_job_response)
+
+        results = await client.query("JobOrder", "salary > 100000")
 
         assert len(results) == 1
         assert results[0]["salary"] == 150000
 
-    @respx.mock
-    def test_query_with_order_by(self, mock_auth, mock_session):
+    async def test_query_with_order_by(self, client, api_routes):
         """Test query with orderBy parameter."""
-        route = respx.get(f"{mock_session.rest_url}/query/JobOrder").mock(
-            return_value=httpx.Response(200, json={"data": []})
-        )
+        route = api_routes["query"]
 
-        client = BullhornClient(mock_auth)
-        client.query("JobOrder", "isOpen=true", order_by="-dateAdded")
+        await client.query("JobOrder", "isOpen=true", order_by="-dateAdded")
 
-        assert "orderBy=-dateAdded" in str(route.calls[0].request.url)
+        assert query_param(route, "orderBy") == "-dateAdded"
 
-    @respx.mock
-    def test_get_entity_by_id(self, mock_auth, mock_session, sample_job):
+    async def test_get_entity_by_id(self, client, api_routes, sample_job_entity_body):
         """Test getting a single entity by ID."""
-        respx.get(f"{mock_session.rest_url}/entity/JobOrder/12345").mock(
-            return_value=httpx.Response(
-                200,
-                json={"data": sample_job},
-            )
+        route = api_routes["entity"].mock(
+            return_value=httpx.Response(200, content=sample_job_entity_body)
         )
 
-        client = BullhornClient(mock_auth)
-        result = client.get("JobOrder", 12345)
+        result = await client.get("JobOrder", 12345)
 
+        assert route.calls[0].request.url.path.endswith("/entity/JobOrder/12345")
         assert result["id"] == 12345
         assert result["title"] == "Software Engineer"
 
-    @respx.mock
-    def test_get_entity_with_custom_fields(self, mock_auth, mock_session):
+    async def test_get_entity_with_custom_fields(self, client, api_routes):
         """Test getting entity with custom fields."""
-        route = respx.get(f"{mock_session.rest_url}/entity/Candidate/67890").mock(
-            return_value=httpx.Response(200, json={"data": {}})
-        )
+        route = api_routes["entity"].mock(return_value=json_response({"data": {}}))
 
-        client = BullhornClient(mock_auth)
-        client.get("Candidate", 67890, fields="id,firstName,lastName,email")
+        await client.get("Candidate", 67890, fields="id,firstName,lastName,email")
 
-        assert "fields=id%2CfirstName%2ClastName%2Cemail" in str(route.calls[0].request.url)
+        assert query_param(route, "fields") == "id,firstName,lastName,email"
 
-    @respx.mock
-    def test_get_meta(self, mock_auth, mock_session):
+    async def test_get_meta(self, client, api_routes):
         """Test getting entity metadata."""
         meta_response = {
             "entity": "JobOrder",
@@ -158,173 +202,193 @@ class TestBullhornClient:
                 {"name": "title", "type": "String"},
             ],
         }
-        respx.get(f"{mock_session.rest_url}/meta/JobOrder").mock(
-            return_value=httpx.Response(200, json=meta_response)
-        )
+        api_routes["meta"].mock(return_value=json_response(meta_response))
 
-        client = BullhornClient(mock_auth)
-        result = client.get_meta("JobOrder")
+        result = await client.get_meta("JobOrder")
 
         assert result["entity"] == "JobOrder"
         assert len(result["fields"]) == 2
 
-    @respx.mock
-    def test_api_error_handling(self, mock_auth, mock_session):
+    async def test_get_meta_cached(self, client, api_routes, monkeypatch, frozen_time):
+        """Test that metadata is cached until the TTL expires."""
+        route = api_routes["meta"].mock(return_value=json_response({"entity": "JobOrder", "fields": []}))
+
+        first = await client.get_meta("JobOrder")
+        second = await client.get_meta("JobOrder")
+
+        assert route.call_count == 1
+        assert second is first
+
+        # Past the TTL the schema is fetched again
+        monkeypatch.setattr(time, "time", lambda: FIXED_NOW + 3601)
+        await client.get_meta("JobOrder")
+
+        assert route.call_count == 2
+
+    async def test_api_error_handling(self, client, api_routes):
         """Test handling of API errors."""
-        respx.get(f"{mock_session.rest_url}/search/JobOrder").mock(
+        api_routes["search"].mock(
             return_value=httpx.Response(500, text="Internal Server Error")
         )
 
-        client = BullhornClient(mock_auth)
-
         with pytest.raises(BullhornAPIError) as exc_info:
-            client.search("JobOrder", "isOpen:1")
+            await client.search("JobOrder", "isOpen:1")
 
         assert "500" in str(exc_info.value)
 
-    @respx.mock
-    def test_session_refresh_on_401(self, mock_auth, mock_session, sample_job):
+    async def test_session_refresh_on_401(
+        self, client, mock_auth, api_routes, mock_session, sample_job_response
+    ):
         """Test that 401 triggers session refresh and retry."""
         # First call returns 401, second succeeds
-        route = respx.get(f"{mock_session.rest_url}/search/JobOrder")
+        route = api_routes["search"]
         route.side_effect = [
-            httpx.Response(401, text="Unauthorized"),
-            httpx.Response(200, json={"data": [sample_job]}),
+            UNAUTHORIZED,
+            sample_job_response,
         ]
 
-        client = BullhornClient(mock_auth)
-        results = client.search("JobOrder", "isOpen:1")
+        results = await client.search("JobOrder", "isOpen:1")
 
         # Should have refreshed session and retried
-        assert mock_auth._refresh_session.called
+        mock_auth._refresh_session.assert_called_once_with(stale=mock_session)
         assert len(results) == 1
 
-
-class TestPagination:
-    """Tests for search and query pagination."""
-
-    @respx.mock
-    def test_search_with_start_offset(self, mock_auth, mock_session):
-        """Test search with start parameter for pagination."""
-        route = respx.get(f"{mock_session.rest_url}/search/JobOrder").mock(
-            return_value=httpx.Response(200, json={"data": []})
+    async def test_valid_session_used_without_worker_thread(
+        self, client, api_routes, monkeypatch
+    ):
+        """Test that a cached, valid session is read on the event loop."""
+        to_thread = Mock(side_effect=AssertionError("unexpected worker thread"))
+        monkeypatch.setattr(asyncio, "to_thread", to_thread)
+
+        await client.search("JobOrder", "isOpen:1")
+
+        to_thread.assert_not_called()
+
+    async def test_session_refresh_runs_off_event_loop(
+        self, client, mock_auth, api_routes, sample_job_response
+    ):
+        """Test that a blocking session refresh doesn't stall other tasks."""
+        released = threading.Event()
+        waited = []
+        mock_auth._refresh_session.side_effect = lambda stale: waited.append(
+            released.wait(timeout=2)
         )
+        api_routes["search"].side_effect = [UNAUTHORIZED, sample_job_response]
 
-        client = BullhornClient(mock_auth)
-        client.search("JobOrder", "isOpen:1", start=50)
-
-        assert "start=50" in str(route.calls[0].request.url)
+        async def release():
+            released.set()
 
-    @respx.mock
-    def test_query_with_start_offset(self, mock_auth, mock_session):
-        """Test query with start parameter for pagination."""
-        route = respx.get(f"{mock_session.rest_url}/query/JobOrder").mock(
-            return_value=httpx.Response(200, json={"data": []})
-        )
-
-        client = BullhornClient(mock_auth)
-        client.query("JobOrder", "salary > 100000", start=100)
+        # Only completes without timing out if release() runs during the refresh
+        await asyncio.gather(client.search("JobOrder", "isOpen:1"), release())
 
-        assert "start=100" in str(route.calls[0].request.url)
+        assert waited == [True]
 
-    @respx.mock
-    def test_search_pagination_combined(self, mock_auth, mock_session):
-        """Test search with both start and count for pagination."""
-        route = respx.get(f"{mock_session.rest_url}/search/Candidate").mock(
-            return_value=httpx.Response(200, json={"data": []})
-        )
+    async def test_close_closes_http_clients(self, client, mock_auth):
+        """Test that closing the client releases both connection pools."""
+        await client.close()
 
-        client = BullhornClient(mock_auth)
-        client.search("Candidate", "status:Active", count=25, start=75)
+        assert client._http.is_closed
+        mock_auth.close.assert_called_once()
 
-        url = str(route.calls[0].request.url)
-        assert "start=75" in url
-        assert "count=25" in url
 
+class TestPagination:
+    """Tests for search and query pagination."""
 
+    @pytest.mark.parametrize(
+        "method,kwargs,expected",
+        [
+            pytest.param(
+                "search",
+                {"entity": "JobOrder", "query": "isOpen:1", "start": 50},
+                {"start": "50"},
+                id="search-start",
+            ),
+            pytest.param(
+                "query",
+                {"entity": "JobOrder", "where": "salary > 100000", "start": 100},
+                {"start": "100"},
+                id="query-start",
+            ),
+            pytest.param(
+                "search",
+                {"entity": "Candidate", "query": "status:Active", "count": 25, "start": 75},
+                {"start": "75", "count": "25"},
+                id="search-start-and-count",
+            ),
+        ],
+    )
+    async def test_pagination(self, client, api_routes, method, kwargs, expected):
+        """Test that start and count are passed through as query params."""
+        route = api_routes[method]
+
+        await getattr(client, method)(**kwargs)
+
+        for key, value in expected.items():
+            assert query_param(route, key) == value
+
+
+@pytest.mark.unit
 class TestDefaultFields:
     """Tests for default field constants."""
 
-    def test_job_order_defaults(self):
-        """Test JobOrder default fields."""
-        assert "id" in DEFAULT_FIELDS["JobOrder"]
-        assert "title" in DEFAULT_FIELDS["JobOrder"]
-        assert "status" in DEFAULT_FIELDS["JobOrder"]
-        assert "salary" in DEFAULT_FIELDS["JobOrder"]
-
-    def test_candidate_defaults(self):
-        """Test Candidate default fields."""
-        assert "id" in DEFAULT_FIELDS["Candidate"]
-        assert "firstName" in DEFAULT_FIELDS["Candidate"]
-        assert "lastName" in DEFAULT_FIELDS["Candidate"]
-        assert "email" in DEFAULT_FIELDS["Candidate"]
-
-    def test_placement_defaults(self):
-        """Test Placement default fields."""
-        assert "id" in DEFAULT_FIELDS["Placement"]
-        assert "candidate" in DEFAULT_FIELDS["Placement"]
-        assert "jobOrder" in DEFAULT_FIELDS["Placement"]
-
-    def test_client_corporation_defaults(self):
-        """Test ClientCorporation default fields."""
-        assert "id" in DEFAULT_FIELDS["ClientCorporation"]
-        assert "name" in DEFAULT_FIELDS["ClientCorporation"]
-        assert "status" in DEFAULT_FIELDS["ClientCorporation"]
-
-    def test_client_contact_defaults(self):
-        """Test ClientContact default fields."""
-        assert "id" in DEFAULT_FIELDS["ClientContact"]
-        assert "firstName" in DEFAULT_FIELDS["ClientContact"]
-        assert "clientCorporation" in DEFAULT_FIELDS["ClientContact"]
+    @pytest.mark.parametrize(
+        "entity,required",
+        [
+            ("JobOrder", {"id", "title", "status", "salary"}),
+            ("Candidate", {"id", "firstName", "lastName", "email"}),
+            ("Placement", {"id", "candidate", "jobOrder"}),
+            ("ClientCorporation", {"id", "name", "status"}),
+            ("ClientContact", {"id", "firstName", "clientCorporation"}),
+        ],
+    )
+    def test_defaults(self, entity, required):
+        """Test that each entity's default fields include the key fields."""
+        assert required <= DEFAULT_FIELDS_SET[entity]
+
+    def test_set_form_covers_every_entity(self):
+        """Test that DEFAULT_FIELDS_SET mirrors DEFAULT_FIELDS."""
+        assert DEFAULT_FIELDS_SET.keys() == DEFAULT_FIELDS.keys()
+        assert DEFAULT_FIELDS_SET["ClientContact"] == {
+            "id", "firstName", "lastName", "email", "phone", "clientCorporation"
+        }
 
 
 class TestEdgeCases:
     """Tests for edge cases and error scenarios."""
 
-    @respx.mock
-    def test_search_empty_results(self, mock_auth, mock_session):
-        """Test search returns empty list when no results."""
-        respx.get(f"{mock_session.rest_url}/search/JobOrder").mock(
-            return_value=httpx.Response(200, json={"data": []})
-        )
-
-        client = BullhornClient(mock_auth)
-        results = client.search("JobOrder", "title:NonexistentJob12345")
-
-        assert results == []
-
-    @respx.mock
-    def test_get_entity_empty_data(self, mock_auth, mock_session):
-        """Test get returns empty dict when entity not found."""
-        respx.get(f"{mock_session.rest_url}/entity/JobOrder/99999").mock(
-            return_value=httpx.Response(200, json={"data": {}})
-        )
-
-        client = BullhornClient(mock_auth)
-        result = client.get("JobOrder", 99999)
-
-        assert result == {}
-
-    @respx.mock
-    def test_query_count_capped_at_500(self, mock_auth, mock_session):
-        """Test that query count is also capped at 500."""
-        route = respx.get(f"{mock_session.rest_url}/query/JobOrder").mock(
-            return_value=httpx.Response(200, json={"data": []})
-        )
-
-        client = BullhornClient(mock_auth)
-        client.query("JobOrder", "isOpen=true", count=1000)
-
-        assert "count=500" in str(route.calls[0].request.url)
-
-    @respx.mock
-    def test_search_unknown_entity_uses_id_field(self, mock_auth, mock_session):
+    @pytest.mark.parametrize(
+        "method,args,route_name,body,expected",
+        [
+            pytest.param(
+                "search",
+                ("JobOrder", "title:NonexistentJob12345"),
+                "search",
+                {"data": []},
+                [],
+                id="search-no-results",
+            ),
+            pytest.param(
+                "get",
+                ("JobOrder", 99999),
+                "entity",
+                {"data": {}},
+                {},
+                id="get-entity-not-found",
+            ),
+        ],
+    )
+    async def test_empty_data(self, client, api_routes, method, args, route_name, body, expected):
+        """Test that an empty data payload is returned as an empty result."""
+        api_routes[route_name].mock(return_value=json_response(body))
+
+        result = await getattr(client, method)(*args)
+
+        assert result == expected
+
+    async def test_search_unknown_entity_uses_id_field(self, client, api_routes):
         """Test that unknown entity types default to 'id' field."""
-        route = respx.get(f"{mock_session.rest_url}/search/UnknownEntity").mock(
-            return_value=httpx.Response(200, json={"data": []})
-        )
+        route = api_routes["search"]
 
-        client = BullhornClient(mock_auth)
-        client.search("UnknownEntity", "someField:value")
+        await client.search("UnknownEntity", "someField:value")
 
-        assert "fields=id" in str(route.calls[0].request.url)
+        assert query_param(route, "fields") == "id"
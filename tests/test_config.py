@@ -4,7 +4,16 @@ import os
 import pytest
 from bullhorn_mcp.config import BullhornConfig
 
+# Minimal environment for a successful from_env()
+REQUIRED_ENV = {
+    "BULLHORN_CLIENT_ID": "env_client_id",
+    "BULLHORN_CLIENT_SECRET": "env_client_secret",
+    "BULLHORN_USERNAME": "env_username",
+    "BULLHORN_PASSWORD": "env_password",
+}
 
+
+@pytest.mark.unit
 class TestBullhornConfig:
     """Tests for BullhornConfig class."""
 
@@ -40,12 +49,16 @@ class TestBullhornConfig:
 
     def test_from_env_with_all_variables(self, monkeypatch):
         """Test loading config from environment variables."""
-        monkeypatch.setenv("BULLHORN_CLIENT_ID", "env_client_id")
-        monkeypatch.setenv("BULLHORN_CLIENT_SECRET", "env_client_secret")
-        monkeypatch.setenv("BULLHORN_USERNAME", "env_username")
-        monkeypatch.setenv("BULLHORN_PASSWORD", "env_password")
-        monkeypatch.setenv("BULLHORN_AUTH_URL", "https://env-auth.example.com")
-        monkeypatch.setenv("BULLHORN_LOGIN_URL", "https://env-login.example.com")
+        # Swap in a plain dict: one patch instead of a setenv per variable
+        monkeypatch.setattr(
+            os,
+            "environ",
+            {
+                **REQUIRED_ENV,
+                "BULLHORN_AUTH_URL": "https://env-auth.example.com",
+                "BULLHORN_LOGIN_URL": "https://env-login.example.com",
+            },
+        )
 
         config = BullhornConfig.from_env()
 
@@ -58,19 +71,24 @@ class TestBullhornConfig:
 
     def test_from_env_with_default_urls(self, monkeypatch):
         """Test loading config with default URLs when not specified."""
-        monkeypatch.setenv("BULLHORN_CLIENT_ID", "env_client_id")
-        monkeypatch.setenv("BULLHORN_CLIENT_SECRET", "env_client_secret")
-        monkeypatch.setenv("BULLHORN_USERNAME", "env_username")
-        monkeypatch.setenv("BULLHORN_PASSWORD", "env_password")
         # Don't set AUTH_URL and LOGIN_URL - should use defaults
-        monkeypatch.delenv("BULLHORN_AUTH_URL", raising=False)
-        monkeypatch.delenv("BULLHORN_LOGIN_URL", raising=False)
+        monkeypatch.setattr(os, "environ", dict(REQUIRED_ENV))
 
         config = BullhornConfig.from_env()
 
         assert config.auth_url == "https://auth.bullhornstaffing.com"
         assert config.login_url == "https://rest.bullhornstaffing.com"
 
+    def test_from_env_session_cache(self, monkeypatch):
+        """Test session cache path defaults to the user cache dir and can be disabled."""
+        monkeypatch.setattr(os, "environ", {**REQUIRED_ENV, "HOME": "/home/tester"})
+
+        config = BullhornConfig.from_env()
+        assert config.session_cache == "/home/tester/.cache/bullhorn_mcp/session.json"
+
+        os.environ["BULLHORN_SESSION_CACHE"] = ""
+        assert BullhornConfig.from_env().session_cache is None
+
     def test_from_env_missing_client_id(self, monkeypatch):
         """Test that missing client_id raises ValueError."""
         # Mock os.getenv to return controlled values
@@ -2,8 +2,11 @@
 
 import json
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock
+from mcp.server.fastmcp.exceptions import ToolError
 from bullhorn_mcp import server
+from bullhorn_mcp.server import get_client  # Unpatched, for TestGetClient
+from bullhorn_mcp.server import SearchSpec
 from bullhorn_mcp.auth import AuthenticationError
 from bullhorn_mcp.client import BullhornAPIError
 
@@ -12,63 +15,120 @@ from bullhorn_mcp.client import BullhornAPIError
 def mock_client(sample_job, sample_candidate):
     """Create a mock Bullhorn client."""
     client = Mock()
-    client.search.return_value = [sample_job]
-    client.query.return_value = [sample_job]
-    client.get.return_value = sample_job
+    client.search = AsyncMock(return_value=[sample_job])
+    client.query = AsyncMock(return_value=[sample_job])
+    client.get = AsyncMock(return_value=sample_job)
     return client
 
 
+def install_capture(mock, return_value) -> dict:
+    """Make ``mock`` return ``return_value`` and record its latest kwargs.
+
+    Returns the dict the keyword arguments of the most recent call are
+    written to.
+    """
+    captured = {}
+
+    def capture(**kwargs):
+        captured.clear()
+        captured.update(kwargs)
+        return return_value
+
+    mock.side_effect = capture
+    return captured
+
+
+@pytest.fixture
+def search_kwargs(mock_client, sample_job):
+    """Keyword arguments of the latest client.search call."""
+    return install_capture(mock_client.search, [sample_job])
+
+
+@pytest.fixture(autouse=True)
+def patched_client(mock_client, monkeypatch):
+    """Route every tool's get_client() to mock_client."""
+    monkeypatch.setattr(server, "get_client", lambda: mock_client)
+    return mock_client
+
+
 @pytest.fixture(autouse=True)
-def reset_client():
-    """Reset the global client before each test."""
-    server._client = None
-    yield
-    server._client = None
+def reset_client(monkeypatch):
+    """Start each test without a global client, restoring it afterwards."""
+    monkeypatch.setattr(server, "_client", None)
+
+
+class TestGetClient:
+    """Tests for lazy client construction."""
+
+    async def test_uses_config_loaded_at_import(self, sample_config, monkeypatch):
+        """Test that the client is built once from the import-time config."""
+        monkeypatch.setattr(server, "_config", sample_config)
+
+        client = get_client()
+
+        assert client.auth.config is sample_config
+        assert get_client() is client
+        await client.close()
+
+    def test_missing_config_reported_on_first_use(self, monkeypatch):
+        """Test that missing credentials surface when the client is first needed."""
+        monkeypatch.setattr(server, "_config", None)
+        monkeypatch.setattr("os.getenv", lambda key, default=None: default)
+
+        with pytest.raises(ValueError) as exc_info:
+            get_client()
+
+        assert "BULLHORN_CLIENT_ID" in str(exc_info.value)
 
 
 class TestListJobs:
     """Tests for list_jobs tool."""
 
-    def test_list_jobs_basic(self, mock_client, sample_job):
+    async def test_list_jobs_basic(self, mock_client, sample_job):
         """Test basic job listing."""
-        with patch.object(server, "get_client", return_value=mock_client):
-            result = server.list_jobs()
+        data = await server._list_jobs_impl()
 
-        data = json.loads(result)
         assert len(data) == 1
         assert data[0]["title"] == "Software Engineer"
         mock_client.search.assert_called_once()
 
-    def test_list_jobs_with_query(self, mock_client):
+    async def test_list_jobs_returns_formatted_json(self, sample_job):
+        """Test that the tool formats its helper's records as JSON."""
+        result = await server.list_jobs()
+
+        assert result == server.format_response([sample_job])
+
+    async def test_list_jobs_with_query(self, search_kwargs):
         """Test job listing with query parameter."""
-        with patch.object(server, "get_client", return_value=mock_client):
-            server.list_jobs(query="title:Engineer")
+        await server.list_jobs(query="title:Engineer")
 
-        call_args = mock_client.search.call_args
-        assert "title:Engineer" in call_args.kwargs["query"]
+        assert "title:Engineer" in search_kwargs["query"]
 
-    def test_list_jobs_with_status(self, mock_client):
+    async def test_list_jobs_with_status(self, search_kwargs):
         """Test job listing with status filter."""
-        with patch.object(server, "get_client", return_value=mock_client):
-            server.list_jobs(status="Open")
+        await server.list_jobs(status="Open")
 
-        call_args = mock_client.search.call_args
-        assert 'status:"Open"' in call_args.kwargs["query"]
+        assert 'status:"Open"' in search_kwargs["query"]
 
-    def test_list_jobs_with_limit(self, mock_client):
+    async def test_list_jobs_with_limit(self, search_kwargs):
         """Test job listing with custom limit."""
-        with patch.object(server, "get_client", return_value=mock_client):
-            server.list_jobs(limit=50)
+        await server.list_jobs(limit=50)
+
+        assert search_kwargs["count"] == 50
 
-        call_args = mock_client.search.call_args
-        assert call_args.kwargs["count"] == 50
+    async def test_list_jobs_limit_clamped(self, search_kwargs):
+        """Test that out-of-range limits are clamped to 1-500."""
+        await server.list_jobs(limit=1000)
+        assert search_kwargs["count"] == 500
 
-    def test_list_jobs_error_handling(self, mock_client):
+        await server.list_jobs(limit=0)
+        assert search_kwargs["count"] == 1
+
+    async def test_list_jobs_error_handling(self, mock_client):
         """Test error handling in list_jobs."""
         mock_client.search.side_effect = BullhornAPIError("API Error")
 
-        with patch.object(server, "get_client", return_value=mock_client):
-            result = server.list_jobs()
+        result = await server.list_jobs()
 
         assert "ERROR:" in result
         assert "API Error" in result
@@ -77,31 +137,26 @@ class TestListJobs:
 class TestListCandidates:
     """Tests for list_candidates tool."""
 
-    def test_list_candidates_basic(self, mock_client, sample_candidate):
+    async def test_list_candidates_basic(self, mock_client, sample_candidate):
         """Test basic candidate listing."""
         mock_client.search.return_value = [sample_candidate]
 
-        with patch.object(server, "get_client", return_value=mock_client):
-            result = server.list_candidates()
+        data = await server._list_candidates_impl()
 
-        data = json.loads(result)
         assert len(data) == 1
         assert data[0]["firstName"] == "John"
 
-    def test_list_candidates_with_query(self, mock_client):
+    async def test_list_candidates_with_query(self, search_kwargs):
         """Test candidate listing with query."""
-        with patch.object(server, "get_client", return_value=mock_client):
-            server.list_candidates(query="skillSet:Python")
+        await server.list_candidates(query="skillSet:Python")
 
-        call_args = mock_client.search.call_args
-        assert "skillSet:Python" in call_args.kwargs["query"]
+        assert "skillSet:Python" in search_kwargs["query"]
 
-    def test_list_candidates_auth_error(self, mock_client):
+    async def test_list_candidates_auth_error(self, mock_client):
         """Test authentication error handling."""
         mock_client.search.side_effect = AuthenticationError("Auth failed")
 
-        with patch.object(server, "get_client", return_value=mock_client):
-            result = server.list_candidates()
+        result = await server.list_candidates()
 
         assert "ERROR:" in result
         assert "Auth failed" in result
@@ -110,21 +165,18 @@ class TestListCandidates:
 class TestGetJob:
     """Tests for get_job tool."""
 
-    def test_get_job_by_id(self, mock_client, sample_job):
+    async def test_get_job_by_id(self, mock_client, sample_job):
         """Test getting a job by ID."""
-        with patch.object(server, "get_client", return_value=mock_client):
-            result = server.get_job(job_id=12345)
+        data = await server._get_job_impl(job_id=12345)
 
-        data = json.loads(result)
         assert data["id"] == 12345
         mock_client.get.assert_called_with(
             entity="JobOrder", entity_id=12345, fields=None
         )
 
-    def test_get_job_with_fields(self, mock_client):
+    async def test_get_job_with_fields(self, mock_client):
         """Test getting a job with custom fields."""
-        with patch.object(server, "get_client", return_value=mock_client):
-            server.get_job(job_id=12345, fields="id,title,salary")
+        await server.get_job(job_id=12345, fields="id,title,salary")
 
         mock_client.get.assert_called_with(
             entity="JobOrder", entity_id=12345, fields="id,title,salary"
@@ -134,14 +186,12 @@ class TestGetJob:
 class TestGetCandidate:
     """Tests for get_candidate tool."""
 
-    def test_get_candidate_by_id(self, mock_client, sample_candidate):
+    async def test_get_candidate_by_id(self, mock_client, sample_candidate):
         """Test getting a candidate by ID."""
         mock_client.get.return_value = sample_candidate
 
-        with patch.object(server, "get_client", return_value=mock_client):
-            result = server.get_candidate(candidate_id=67890)
+        data = await server._get_candidate_impl(candidate_id=67890)
 
-        data = json.loads(result)
         assert data["firstName"] == "John"
         assert data["lastName"] == "Smith"
 
@@ -149,66 +199,160 @@ class TestGetCandidate:
 class TestSearchEntities:
     """Tests for search_entities tool."""
 
-    def test_search_placements(self, mock_client):
-        """Test searching placements."""
-        mock_client.search.return_value = [{"id": 1, "status": "Approved"}]
+    @pytest.mark.parametrize(
+        "kwargs,expected_count",
+        [
+            pytest.param({"entity": "Placement", "query": "status:Approved"}, 20, id="default-limit"),
+            pytest.param(
+                {"entity": "ClientCorporation", "query": "name:Acme*", "limit": 100},
+                100,
+                id="custom-limit",
+            ),
+            pytest.param(
+                {"entity": "Placement", "query": "status:Approved", "limit": 1000},
+                500,
+                id="limit-clamped",
+            ),
+        ],
+    )
+    async def test_search_entities(self, mock_client, kwargs, expected_count):
+        """Test that searches are passed to the client with a clamped count."""
+        data = await server._search_entities_impl(**kwargs)
+
+        assert data is mock_client.search.return_value
+        mock_client.search.assert_called_once_with(
+            entity=kwargs["entity"],
+            query=kwargs["query"],
+            fields=None,
+            count=expected_count,
+        )
+
 
-        with patch.object(server, "get_client", return_value=mock_client):
-            result = server.search_entities(
-                entity="Placement", query="status:Approved"
-            )
+class TestMultiSearch:
+    """Tests for multi_search tool."""
+
+    async def test_multi_search(self, mock_client, sample_job, sample_candidate):
+        """Test fanning out several searches in one call."""
+        mock_client.search_many = AsyncMock(return_value=[[sample_job], [sample_candidate]])
+
+        result = await server.multi_search(
+            searches=[
+                SearchSpec(entity="JobOrder", query="isOpen:1"),
+                SearchSpec(entity="Candidate", query="skillSet:Python", limit=5, fields="id"),
+            ]
+        )
 
         data = json.loads(result)
-        assert data[0]["status"] == "Approved"
-        mock_client.search.assert_called_with(
-            entity="Placement",
-            query="status:Approved",
-            fields=None,
-            count=20,
+        assert data[0][0]["id"] == 12345
+        assert data[1][0]["id"] == 67890
+        mock_client.search_many.assert_called_once_with(
+            [
+                ("JobOrder", "isOpen:1", {"fields": None, "count": 20}),
+                ("Candidate", "skillSet:Python", {"fields": "id", "count": 5}),
+            ]
+        )
+
+    async def test_multi_search_reports_failed_search_in_place(self, mock_client, sample_job):
+        """Test that a failed search is reported without discarding the others."""
+        mock_client.search_many = AsyncMock(
+            return_value=[[sample_job], BullhornAPIError("API request failed: 400 - Bad query")]
+        )
+
+        result = await server.multi_search(
+            searches=[
+                SearchSpec(entity="JobOrder", query="isOpen:1"),
+                SearchSpec(entity="Candidate", query="bad:["),
+            ]
         )
 
-    def test_search_with_limit(self, mock_client):
-        """Test search with custom limit."""
-        with patch.object(server, "get_client", return_value=mock_client):
-            server.search_entities(
-                entity="ClientCorporation", query="name:Acme*", limit=100
-            )
+        data = json.loads(result)
+        assert data[0][0]["id"] == 12345
+        assert data[1] == {"error": "API request failed: 400 - Bad query"}
+
+    @pytest.mark.parametrize(
+        "count",
+        [
+            pytest.param(0, id="empty"),
+            pytest.param(server.MAX_SEARCHES + 1, id="too-many"),
+        ],
+    )
+    async def test_multi_search_batch_size_validated(self, mock_client, count):
+        """Test that the number of searches per call is capped."""
+        mock_client.search_many = AsyncMock()
+        spec = {"entity": "JobOrder", "query": "isOpen:1"}
+
+        with pytest.raises(ToolError):
+            await server.mcp.call_tool("multi_search", {"searches": [spec] * count})
+
+        mock_client.search_many.assert_not_called()
+
+    async def test_multi_search_coerces_limit(self, mock_client):
+        """Test that a numeric-string limit is validated into an int."""
+        mock_client.search_many = AsyncMock(return_value=[[]])
+
+        await server.mcp.call_tool(
+            "multi_search",
+            {"searches": [{"entity": "JobOrder", "query": "isOpen:1", "limit": "10"}]},
+        )
+
+        mock_client.search_many.assert_called_once_with(
+            [("JobOrder", "isOpen:1", {"fields": None, "count": 10})]
+        )
 
-        call_args = mock_client.search.call_args
-        assert call_args.kwargs["count"] == 100
+    @pytest.mark.parametrize(
+        "spec",
+        [
+            pytest.param({"entity": "JobOrder"}, id="missing-query"),
+            pytest.param({"entity": "JobOrder", "query": "isOpen:1", "limit": None}, id="null-limit"),
+            pytest.param({"entity": "JobOrder", "query": "isOpen:1", "limit": "ten"}, id="non-int-limit"),
+        ],
+    )
+    async def test_multi_search_invalid_spec(self, mock_client, spec):
+        """Test that malformed search specs are rejected before any request."""
+        mock_client.search_many = AsyncMock()
+
+        with pytest.raises(ToolError):
+            await server.mcp.call_tool("multi_search", {"searches": [spec]})
+
+        mock_client.search_many.assert_not_called()
 
 
 class TestQueryEntities:
     """Tests for query_entities tool."""
 
-    def test_query_with_where(self, mock_client):
-        """Test query with WHERE clause."""
-        with patch.object(server, "get_client", return_value=mock_client):
-            server.query_entities(
-                entity="JobOrder", where="salary > 100000"
-            )
-
-        mock_client.query.assert_called_with(
-            entity="JobOrder",
-            where="salary > 100000",
+    @pytest.mark.parametrize(
+        "kwargs,expected",
+        [
+            pytest.param(
+                {"entity": "JobOrder", "where": "salary > 100000"},
+                {"count": 20, "order_by": None},
+                id="where",
+            ),
+            pytest.param(
+                {"entity": "Candidate", "where": "status='Active'", "order_by": "-dateAdded"},
+                {"count": 20, "order_by": "-dateAdded"},
+                id="order-by",
+            ),
+            pytest.param(
+                {"entity": "JobOrder", "where": "isOpen=true", "limit": 1000},
+                {"count": 500, "order_by": None},
+                id="limit-clamped",
+            ),
+        ],
+    )
+    async def test_query_entities(self, mock_client, kwargs, expected):
+        """Test that queries are passed to the client with a clamped count."""
+        await server.query_entities(**kwargs)
+
+        mock_client.query.assert_called_once_with(
+            entity=kwargs["entity"],
+            where=kwargs["where"],
             fields=None,
-            count=20,
-            order_by=None,
+            **expected,
         )
 
-    def test_query_with_order_by(self, mock_client):
-        """Test query with ORDER BY."""
-        with patch.object(server, "get_client", return_value=mock_client):
-            server.query_entities(
-                entity="Candidate",
-                where="status='Active'",
-                order_by="-dateAdded",
-            )
-
-        call_args = mock_client.query.call_args
-        assert call_args.kwargs["order_by"] == "-dateAdded"
-
 
+@pytest.mark.unit
 class TestFormatResponse:
     """Tests for response formatting."""
 
@@ -237,21 +381,51 @@ class TestFormatResponse:
         result = server.format_response(data)
         assert "2024" in result
 
+    def test_format_large_list_compact(self):
+        """Test that large result sets skip indentation."""
+        small = server.format_response([{"id": i} for i in range(server.COMPACT_THRESHOLD)])
+        large = server.format_response([{"id": i} for i in range(server.COMPACT_THRESHOLD + 1)])
+
+        assert "\n" in small
+        assert "\n" not in large
+        assert len(json.loads(large)) == server.COMPACT_THRESHOLD + 1
+
+    def test_format_non_string_keys(self):
+        """Test formatting dicts keyed by integers."""
+        result = server.format_response({1: "a"})
 
+        assert json.loads(result) == {"1": "a"}
+
+
+@pytest.mark.unit
 class TestMCPServerSetup:
     """Tests for MCP server configuration."""
 
     def test_server_has_tools(self):
         """Test that all expected tools are registered."""
-        tools = list(server.mcp._tool_manager._tools.keys())
-
-        assert "list_jobs" in tools
-        assert "list_candidates" in tools
-        assert "get_job" in tools
-        assert "get_candidate" in tools
-        assert "search_entities" in tools
-        assert "query_entities" in tools
+        expected = {
+            "list_jobs",
+            "list_candidates",
+            "get_job",
+            "get_candidate",
+            "search_entities",
+            "multi_search",
+            "query_entities",
+        }
+
+        assert expected <= server.mcp._tool_manager._tools.keys()
 
     def test_server_name(self):
         """Test server name is set correctly."""
         assert server.mcp.name == "Bullhorn CRM"
+
+    async def test_serve_closes_client_on_exit(self, monkeypatch):
+        """Test that the shared client is closed once the server stops."""
+        monkeypatch.setattr(server.mcp, "run_stdio_async", AsyncMock())
+        client = AsyncMock()
+        server._client = client
+
+        await server._serve()
+
+        client.close.assert_called_once()
+        assert server._client is None
@@ -0,0 +1,44 @@
+"""Tests for Bullhorn session objects."""
+
+import pytest
+from bullhorn_mcp.auth import BullhornSession
+
+# Reference time for expiry arithmetic; nothing here reads the clock
+NOW = 1_700_000_000.0
+
+
+@pytest.mark.unit
+class TestBullhornSession:
+    """Tests for BullhornSession class."""
+
+    def test_session_creation(self):
+        """Test creating a session."""
+        session = BullhornSession(
+            bh_rest_token="token123",
+            rest_url="https://rest99.bullhornstaffing.com/rest-services/abc/",
+            expires_at=NOW + 600,
+        )
+
+        assert session.bh_rest_token == "token123"
+        assert session.rest_url == "https://rest99.bullhornstaffing.com/rest-services/abc/"
+        assert session.headers == {"BhRestToken": "token123"}
+        assert session.base_url == "https://rest99.bullhornstaffing.com/rest-services/abc"
+        assert not hasattr(session, "__dict__")
+
+    def test_session_expiry(self):
+        """Test session expiry tracking."""
+        # Session that expires in the future
+        future_session = BullhornSession(
+            bh_rest_token="token",
+            rest_url="https://rest.example.com/",
+            expires_at=NOW + 600,
+        )
+        assert future_session.expires_at > NOW
+
+        # Session that has expired
+        expired_session = BullhornSession(
+            bh_rest_token="token",
+            rest_url="https://rest.example.com/",
+            expires_at=NOW - 100,
+        )
+        assert expired_session.expires_at < NOW